@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: vectorized fixed-precision encoder of the NA writer vs. f-strings.
+
+Run from the repository root:
+
+    python benchmarks/bench_encode.py [n_values]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "nc2na"))
+
+from na_lib.na1001 import _format_column, _format_rows
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+REPEAT = 3
+
+rng = np.random.default_rng(0)
+cases = {
+    ".3f, float64": (rng.normal(0, 1000, N), ".3f"),
+    ".1f, float32": (rng.normal(0, 10, N).astype(np.float32), ".1f"),
+    "d, int64": (rng.integers(-(10**6), 10**6, N), "d"),
+    "d, float64 with NaN": (np.where(rng.random(N) < 0.1, np.nan, rng.normal(0, 1e4, N)), "d"),
+}
+
+
+def f_string(values: np.ndarray, fmt: str) -> list[str]:
+    """The caller-side path, e.g. format_var in convert_nc_2_na_GUI.py."""
+    return [f"{v:{fmt}}" for v in values]
+
+
+print(f"{N:,} values, best of {REPEAT}")
+print(f"{'case':<28}{'f-string':>12}{'encoder':>12}{'speedup':>10}")
+for name, (values, fmt) in cases.items():
+    if fmt == "d":  # f-strings cannot format floats with "d"
+        ref_values = np.where(np.isnan(values), -9999, np.rint(values)).astype(np.int64)
+    else:
+        ref_values = values
+    t_ref = min(timeit.repeat(lambda r=ref_values, f=fmt: f_string(r, f), number=1, repeat=REPEAT))
+    t_enc = min(
+        timeit.repeat(
+            lambda a=values, f=fmt: _format_column(a, f, "-9999"), number=1, repeat=REPEAT
+        )
+    )
+    assert _format_column(values, fmt, "-9999") == f_string(ref_values, fmt)
+    print(f"{name:<28}{t_ref:>11.3f}s{t_enc:>11.3f}s{t_ref / t_enc:>9.1f}x")
+
+# complete data block as written by to_file: X plus 10 variables
+n_rows = N // 10
+x, v = np.arange(n_rows) * 0.1, rng.normal(0, 100, (10, n_rows))
+vmiss, formats = ["-9999"] * 10, (".1f", [".3f"] * 10)
+
+
+def f_string_block() -> str:
+    """Pre-formatted lists of str, as passed by callers before numeric input was supported."""
+    return _format_rows(f_string(x, ".1f"), [f_string(v_j, ".3f") for v_j in v], vmiss, None)
+
+
+t_ref = min(timeit.repeat(f_string_block, number=1, repeat=REPEAT))
+t_enc = min(timeit.repeat(lambda: _format_rows(x, v, vmiss, formats), number=1, repeat=REPEAT))
+assert _format_rows(x, v, vmiss, formats) == f_string_block()
+name = f"data block, {n_rows:,} rows"
+print(f"{name:<28}{t_ref:>11.3f}s{t_enc:>11.3f}s{t_ref / t_enc:>9.1f}x")
@@ -39,10 +39,10 @@ def find_files(src: Path) -> Optional[list[Path]]:
     return files
 
 
-def format_var(da: xr.DataArray) -> tuple[str, list[str]]:
+def format_var(da: xr.DataArray) -> tuple[str, np.ndarray]:
     """
     Since input must not me masked or scaled, we need to apply that before
-    output to text.
+    output to text. Values stay numeric; they are formatted by the NA writer.
     """
     _scale = da.attrs.get("scale", 1)
     if not np.isclose(_scale, 1):
@@ -51,15 +51,15 @@ def format_var(da: xr.DataArray) -> tuple[str, list[str]]:
     # if vmiss is not specified, we have to short-cut...
     _vmiss = da.attrs.get("missing_value") or da.attrs.get("_FillValue")
     if _vmiss is None:
-        return (VMISS, [f"{v:{FORMAT_DIRECTIVE_VAR}}" for v in da.values])
+        return (VMISS, da.values)
 
     # floating point arrays must have NaN set correctly
     if isinstance(da.values[0], np.floating):
         da.values[np.isclose(da.values, _vmiss)] = np.nan
-        return (VMISS, [f"{v:{FORMAT_DIRECTIVE_VAR}}" for v in da.values])
+        return (VMISS, da.values)
 
     # otherwise, the type cannot represent NaN, so we need to return actual vmiss
-    return (str(_vmiss), [f"{v:{FORMAT_DIRECTIVE_VAR}}" for v in da.values])
+    return (str(_vmiss), da.values)
 
 
 def nc2na(src: Path) -> None:
@@ -102,7 +102,7 @@ def nc2na(src: Path) -> None:
 
     na.VNAME = vnames
     na.VSCAL = [VSCAL for _ in vnames]
-    na.X = [f"{t:{FORMAT_DIRECITVE_IVAR}}" for t in seconds_after_midnight]
+    na.X = seconds_after_midnight
 
     na.VMISS = []
     na.V = []
@@ -111,7 +111,13 @@ def nc2na(src: Path) -> None:
         na.VMISS.append(_vmiss)
         na.V.append(_data)
 
-    na.to_file(dst, sep_data=DATA_DELIMITER, overwrite=1)
+    na.to_file(
+        dst,
+        sep_data=DATA_DELIMITER,
+        overwrite=1,
+        formats=FORMAT_DIRECTIVE_VAR,
+        x_format=FORMAT_DIRECITVE_IVAR,
+    )
 
 
 def convert() -> None:
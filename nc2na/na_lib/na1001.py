@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
 """NASA Ames FFI 1001 text file format reader / writer."""
 
+import io
+import mmap
 import os
+import re
+import time
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timezone
+from functools import partial
+from itertools import islice
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Union
 
@@ -15,12 +26,14 @@ class FFI1001(object):
 
     Parameters
     ----------
-    file : str or pathlib.Path or file-like
-        data source.
+    file : str or pathlib.Path or file-like or bytes-like
+        data source. bytes, bytearray, memoryview and mmap are used without copy.
     sep : str, optional
         General delimiter. The default is " ".
-    sep_data : str, optional
-        Delimiter used exclusively in data block. The default is "\t".
+    sep_data : str or None, optional
+        Delimiter used exclusively in data block. None splits at any run of
+        whitespace, e.g. for space-aligned columns. "auto" uses tab if the
+        first data line is tab-delimited, else whitespace runs. The default is "\t".
     strip_lines : bool, optional
         Remove surrounding whitespaces from all lines before parsing.
         The default is True.
@@ -28,23 +41,92 @@ class FFI1001(object):
         Automatically determine number of lines in comment blocks.
         The default is True.
     rmv_repeated_seps : bool, optional
-        Remove repeated delimiters (e.g. double space). The default is False.
+        Remove repeated delimiters (e.g. double space). Not supported in numeric
+        mode, where sep_data=None handles repeated whitespace. The default is False.
     vscale_vmiss_vertical : bool, optional
         VSCALE and VMISS parameters are arranged vertically over multiple
         lines (1 entry per line) instead of in one line each.
         The default is False.
     vmiss_to_None : bool, optional
-        Set True if missing values should be replaced with None. The default is False.
+        Set True if missing values should be replaced with None. Not supported in
+        numeric mode, see physical. The default is False.
     ensure_ascii : bool, optional
         Enforce ASCII-decoding of the input. The default is True.
     allow_emtpy_data : bool, optional
         Allow header-only input. The default is False.
+    numeric : bool, optional
+        Parse the data block directly from bytes into numpy arrays instead of
+        lists of str. X then is a 1-D array and V a 2-D array of shape (NV, n_rows).
+        The default is False.
+    dtype : numpy dtype, optional
+        Data type of the numeric arrays; np.float32 halves memory use but might
+        not resolve X with sufficient precision. Only used if numeric=True.
+        The default is np.float64.
+    lazy : bool, optional
+        Only parse the header at construction. X, V and single variables (see
+        get_var) are parsed from the retained file content on first access and
+        memoized. Implies numeric=True. The default is False.
+    memory_map : bool, optional
+        Map the file into memory instead of reading it. Implies lazy=True.
+        The default is False.
+    header_only : bool, optional
+        Only read the NLHEAD header lines, e.g. to scan many files for their
+        metadata. X and V are left empty. The default is False.
+    variables : list of str or int, optional
+        Only load these dependent variables, specified by VNAME entry or index.
+        NV, VNAME, VSCAL and VMISS are reduced accordingly. The default is None (all).
+    workers : int, optional
+        Number of processes to parse the data block in parallel. Only used if
+        numeric=True; most efficient if file is a path, which is then memory-mapped
+        instead of read. The default is 1.
+    validate : str, optional
+        "full" checks header consistency and every data line. "header" skips the
+        line-by-line checks and stripping of values in favor of one shape check of
+        the whole data block, which is suitable for trusted input, e.g. files written
+        by this module. "none" additionally skips header consistency checks.
+        The default is "full".
+    physical : str, optional
+        Return V as physical values, i.e. multiplied by VSCAL, with VMISS identified
+        by numeric comparison. "nan" sets missing values to NaN, "mask" returns a
+        numpy masked array. VSCAL is then set to "1" for all variables, so that
+        V is written as is by to_file. Implies numeric=True. The default is None
+        (raw values).
 
     Returns
     -------
     FFI 1001 class instance.
     """
 
+    # fixed set of attributes, see KEYS; X and V are stored as numpy arrays in numeric
+    # mode, with V being a (NV, n_rows) view on one row-major block that also holds X
+    __slots__ = (
+        "NLHEAD",
+        "ONAME",
+        "ORG",
+        "SNAME",
+        "MNAME",
+        "IVOL",
+        "NVOL",
+        "DATE",
+        "RDATE",
+        "_DX",
+        "XNAME",
+        "NV",
+        "VSCAL",
+        "VMISS",
+        "_VNAME",
+        "NSCOML",
+        "_SCOM",
+        "NNCOML",
+        "_NCOM",
+        "_X",
+        "_V",
+        "_SRC",
+        "_HEADER",
+        "_DATA",
+        "_FORMATS",
+    )
+
     def __init__(self, file=None, **kwargs):
         today = datetime.now(timezone.utc).date()
         self.NLHEAD = 14  # minimum number of header lines is 14
@@ -70,6 +152,8 @@ class FFI1001(object):
         self.V = [[""]]
         self._SRC = "path to file"
         self._HEADER = "file header"
+        self._DATA = None  # unparsed data block if read with lazy=True
+        self._FORMATS = None  # (X format, V formats) applied to numeric data on write
 
         if file is not None:
             self.__from_file(file, **kwargs)
@@ -112,23 +196,31 @@ class FFI1001(object):
     @property
     def X(self) -> list[str]:
         """Independent variable"""
+        if self._X is None and self._DATA is not None:
+            self._X = self._DATA.column(0)
         return self._X
 
     @X.setter
     def X(self, xarr: list[str]):
         self._X = xarr
-        # calculate dx as unique diffs in X,
-        # unique with floats might fail, so add a round to 4 decimals:
-        dx = np.unique(np.diff(np.array(xarr, dtype=float)).round(4))
-        # let dx be 0 if there's more than one unique diff
-        dx = dx[0] if dx.size == 1 else 0
-        # use an integer if dx is close to its integer value, else float:
-        dx = int(dx) if np.isclose(dx, int(dx)) else dx
-        self.DX = dx
+        self._DX = None  # derived from X on next access, see x_spacing
+
+    @property
+    def DX(self) -> float:
+        """Interval of the independent variable, 0 if not constant"""
+        if self._DX is None:
+            self._DX = self.x_spacing()["dx"]
+        return self._DX
+
+    @DX.setter
+    def DX(self, value: float):
+        self._DX = value
 
     @property
     def V(self) -> list[list[str],]:
         """Dependent variable"""
+        if self._V is None and self._DATA is not None:
+            self._load_data()
         return self._V
 
     @V.setter
@@ -145,6 +237,255 @@ class FFI1001(object):
         for k in KEYS:
             setattr(self, k, nadict[k])
 
+    def _load_data(self):
+        """Parse the complete data block of a lazily loaded file."""
+        self._X, self._V = self._DATA.columns()
+        self._DATA = None
+
+    def x_spacing(self) -> dict:
+        """
+        Step statistics of the independent variable.
+
+        Steps are compared rounded to 4 decimals. X is regular if all steps are
+        equal; otherwise, steps larger than the minimum step are reported as gaps.
+
+        Returns
+        -------
+        dict
+            "dx" (DX derived from X), "min" and "max" step, "regular" (bool),
+            "n_gaps" and "gaps" (indices i with a gap between X[i] and X[i+1]).
+
+        """
+        return _x_spacing(self.X)
+
+    def get_var(self, var: Union[str, int]):
+        """
+        Values of a single dependent variable.
+
+        If the file was loaded lazily, only this variable is parsed on first access.
+
+        Parameters
+        ----------
+        var : str or int
+            VNAME entry or index of the variable.
+
+        Returns
+        -------
+        numpy.ndarray or list
+            values of the variable.
+
+        """
+        j = _select_columns([var], self._VNAME)[0]
+        if self._V is None and self._DATA is not None:
+            return self._DATA.column(j + 1)
+        return self._V[j]
+
+    # ------------------------------------------------------------------------------
+    @staticmethod
+    def iter_chunks(file, rows: int = 100_000, **kwargs) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over the data of a NASA Ames 1001 file without loading it completely.
+
+        Parameters
+        ----------
+        file : str or pathlib.Path or file-like or bytes-like
+            data source.
+        rows : int, optional
+            Maximum number of data lines per chunk. The default is 100_000.
+        **kwargs
+            Passed on to the reader, see class docstring; options that apply
+            to the complete data block (numeric, lazy, memory_map, workers,
+            allow_emtpy_data, header_only) raise TypeError.
+
+        Yields
+        ------
+        tuple of numpy.ndarray
+            X with shape (n_rows,) and V with shape (NV, n_rows) of the current chunk.
+
+        """
+        return na1001_iter_chunks(file, rows, **kwargs)
+
+    # ------------------------------------------------------------------------------
+    @staticmethod
+    def read_rows(
+        file: Union[str, Path], start: int = 0, stop=None, **kwargs
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Read rows start to stop of a file written with to_file(fixed_width=True).
+
+        As all data lines have the same length, the offset of a row is known and
+        only the requested rows are read and parsed.
+
+        Parameters
+        ----------
+        file : str or pathlib.Path
+            data source.
+        start, stop : int, optional
+            Row range like a slice; negative values count from the end.
+            The default is all rows.
+        **kwargs
+            sep_data, dtype, variables, physical and header options, see class
+            docstring; options that apply to the complete data block raise
+            TypeError, see iter_chunks. ValueError is raised if the file is not
+            fixed-width.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            X with shape (n_rows,) and V with shape (NV, n_rows).
+
+        """
+        return na1001_read_rows(file, start, stop, **kwargs)
+
+    @classmethod
+    def read_many(cls, paths, workers: int = 1, **kwargs) -> "FFI1001":
+        """
+        Load multiple NASA Ames 1001 files with identical VNAME into one instance.
+
+        Data is read in numeric mode; X and V are concatenated in the order of
+        paths, all other attributes are taken from the first file.
+
+        Parameters
+        ----------
+        paths : list of str or pathlib.Path
+            files to load.
+        workers : int, optional
+            Number of processes parsing files in parallel, directly into one array
+            in shared memory, which is returned without copy. The default is 1.
+        **kwargs
+            Passed on to the reader, see class docstring and iter_chunks.
+
+        Returns
+        -------
+        FFI 1001 class instance.
+
+        """
+        na = cls()
+        nadict = na1001_read_many(paths, workers, **kwargs)
+        for k in KEYS:
+            setattr(na, k, nadict[k])
+        return na
+
+    @classmethod
+    def read_volumes(cls, paths, workers: int = 1, **kwargs) -> "FFI1001":
+        """
+        Load the volumes of a dataset, e.g. written by to_volumes, into one instance.
+
+        Volumes are ordered by IVOL, which must cover 1 to NVOL; the result has
+        IVOL = NVOL = 1. Data is read in numeric mode, see read_many.
+
+        Parameters
+        ----------
+        paths : list of str or pathlib.Path
+            all volume files, in any order.
+        workers : int, optional
+            Number of processes parsing volumes in parallel. The default is 1.
+        **kwargs
+            Passed on to the reader, see class docstring and iter_chunks.
+
+        Returns
+        -------
+        FFI 1001 class instance.
+
+        """
+        na = cls()
+        nadict = na1001_read_volumes(paths, workers, **kwargs)
+        for k in KEYS:
+            setattr(na, k, nadict[k])
+        return na
+
+    # ------------------------------------------------------------------------------
+    @staticmethod
+    def append_rows(file: Union[str, Path], x, v, **kwargs) -> int:
+        """
+        Append rows to an existing NASA Ames 1001 file without rewriting it.
+
+        Only the header is read, to validate it against the new data; then the
+        formatted rows are appended at the end of the file.
+
+        Parameters
+        ----------
+        file : str or pathlib.Path
+            file to append to.
+        x : array-like
+            independent variable, shape (n_rows,); numbers or str. Numbers are
+            formatted with x_format, also if given as list.
+        v : array-like
+            dependent variables, shape (NV, n_rows); numbers or str. Numbers are
+            formatted with formats; NaN and values equal to VMISS are written as
+            the VMISS of the file.
+        vnames : list of str, optional
+            Expected VNAME of the file. The default is None (not checked).
+        vmiss : list of str or float, optional
+            Expected VMISS of the file, compared as numbers, so -9999.0 matches
+            "-9999". The default is None (not checked).
+        sep_data : str, optional
+            Delimiter to separate data columns. The default is "\t".
+        formats : str or list of str, optional
+            Format spec for numeric V, see to_file. The default is None (str()).
+        x_format : str, optional
+            Format spec for numeric X. The default is None (str()).
+        **kwargs
+            Passed on to the header reader, see class docstring and iter_chunks;
+            variables, physical and dtype raise TypeError, as rows always have all
+            variables.
+
+        Returns
+        -------
+        int
+            number of rows appended.
+
+        """
+        return na1001_append_rows(file, x, v, **kwargs)
+
+    # ------------------------------------------------------------------------------
+    @classmethod
+    def from_arrays(
+        cls, x, v, vnames: list[str], formats=None, x_format=None, **kwargs
+    ) -> "FFI1001":
+        """
+        Create FFI 1001 class instance from numeric data.
+
+        X and V are stored as numpy arrays; values are only formatted to str
+        when the instance is written to file.
+
+        Parameters
+        ----------
+        x : array-like
+            independent variable, shape (n_rows,).
+        v : array-like
+            dependent variables, shape (NV, n_rows). NaN and masked values of a
+            numpy masked array are written as VMISS.
+        vnames : list of str
+            VNAME entries, one per row of v.
+        formats : str or list of str, optional
+            Format spec for V (see format()), e.g. ".3f", "g" or "d"; one for all
+            variables or one per variable. The default is None (str()).
+        x_format : str, optional
+            Format spec for X. The default is None (str()).
+        **kwargs
+            Other attributes to set, e.g. ONAME, DATE, VMISS or NCOM. VSCAL and VMISS
+            default to "1" and "-9999" for each variable.
+
+        Returns
+        -------
+        FFI 1001 class instance.
+
+        """
+        v = np.asanyarray(v)
+        if v.ndim != 2 or v.shape[0] != len(vnames):
+            raise ValueError(f"v must have shape ({len(vnames)}, n_rows), got {v.shape}")
+
+        na = cls()
+        na.VNAME = list(vnames)
+        na.VSCAL, na.VMISS = ["1"] * na.NV, ["-9999"] * na.NV
+        na.X, na.V = np.asanyarray(x), v
+        for k, val in kwargs.items():  # after X, which resets DX
+            setattr(na, k, val)
+        na._FORMATS = (x_format, _check_formats(formats, na.NV))
+        na._SRC = "arrays"
+        return na
+
     # ------------------------------------------------------------------------------
     def to_file(self, file: Union[str, Path], **kwargs):
         """
@@ -162,6 +503,25 @@ class FFI1001(object):
             Set to 1 to overwrite existing files. The default is 0 (no overwrite).
         verbose : bool, optional
             Verbose print output if True. The default is False.
+        formats : str or list of str, optional
+            Format spec (see format()) for numeric V, e.g. ".3f", "g" or "d"; one for
+            all variables or one per variable. Overrides formats set by from_arrays.
+            The default is None (str()).
+        x_format : str, optional
+            Format spec for numeric X. The default is None (str()).
+        fixed_width : bool, optional
+            Right-align the values of each column to a common width, so that all
+            data lines have the same length in bytes; see read_rows. Widths are
+            those of the longest formatted value, or of the format spec if it
+            specifies one (e.g. "10.3f"). The default is False.
+        workers : int, optional
+            Number of processes formatting blocks of rows in parallel. Formatted
+            blocks are written in order while the following blocks are formatted;
+            with fixed_width=True, they are written in parallel. The default is 1.
+        header : NA1001Header, optional
+            Precompiled header, see header_template; only IVOL, NVOL, DATE, RDATE
+            and DX are taken from this instance. sep is that of the template.
+            The default is None (render the complete header).
 
         Returns
         -------
@@ -169,15 +529,128 @@ class FFI1001(object):
             0 -> failed, 1 -> successful write, 2 -> successful overwrite.
 
         """
-        io = na1001_cls_write(file, self.__dict__, **kwargs)
+        if self._DATA is not None:
+            self._load_data()
+        nadict = self._as_dict()
+        io = na1001_cls_write(file, nadict, **kwargs)
+        for k in ("NV", "NSCOML", "NNCOML", "NLHEAD"):  # might have been corrected
+            setattr(self, k, nadict[k])
         return io
 
+    def to_volumes(
+        self, file: Union[str, Path], max_rows=None, max_bytes=None, workers: int = 1, **kwargs
+    ) -> list[Path]:
+        """
+        Write NASA Ames 1001 files split into volumes, e.g. for very long records.
+
+        Volumes have identical headers except for IVOL, and NVOL set to the number
+        of volumes. They are named like file with the volume number appended to
+        the stem, e.g. data_1.na, data_2.na.
+
+        Parameters
+        ----------
+        file : str or pathlib.Path
+            filepath and -name of the destination, without volume number.
+        max_rows : int, optional
+            Maximum number of data lines per volume.
+        max_bytes : int, optional
+            Maximum file size per volume, including the header. Each volume has at
+            least one data line. Either max_rows or max_bytes must be given.
+        workers : int, optional
+            Number of processes writing volumes in parallel. With max_bytes, rows
+            are formatted once in parallel blocks to find the volume limits, and
+            volumes are written from this text. The default is 1.
+        **kwargs
+            sep, sep_data, overwrite, verbose, formats, x_format and header, see to_file.
+
+        Returns
+        -------
+        list of pathlib.Path
+            the volumes written, in order of IVOL; empty if a volume exists and
+            overwrite is not set.
+
+        """
+        if self._DATA is not None:
+            self._load_data()
+        return na1001_write_volumes(file, self._as_dict(), max_rows, max_bytes, workers, **kwargs)
+
+    def iter_bytes(self, chunk_rows: int = 10_000, **kwargs) -> Iterator[bytes]:
+        """
+        Serialize to NASA Ames 1001 as ASCII-encoded chunks, e.g. for streaming.
+
+        Yields the header first, then the data block in chunks of chunk_rows
+        lines; rows are formatted per chunk, so memory use is bounded by chunk_rows.
+        Line endings are always "\\n".
+
+        Parameters
+        ----------
+        chunk_rows : int, optional
+            Number of data lines per chunk. The default is 10_000.
+        **kwargs
+            sep, sep_data, verbose, formats, x_format, workers and header, see to_file.
+
+        Yields
+        ------
+        bytes
+            consecutive parts of the file content.
+
+        """
+        if self._DATA is not None:
+            self._load_data()
+        return na1001_iter_bytes(self._as_dict(), chunk_rows, **kwargs)
+
+    def writer(self, file: Union[str, Path], **kwargs) -> "NA1001Writer":
+        """
+        Open a NA1001Writer with the header of this instance, to append rows
+        incrementally. See NA1001Writer for keyword arguments.
+        """
+        return NA1001Writer(file, self, **kwargs)
+
+    def header_template(self, sep: str = " ") -> "NA1001Header":
+        """
+        Precompile the header of this instance, to write many files with the same
+        variables and comments. See NA1001Header.
+        """
+        return NA1001Header(self, sep)
+
+    def _as_dict(self) -> dict:
+        """All attributes listed in KEYS."""
+        return {k: getattr(self, k) for k in KEYS}
+
+    def to_lists(self) -> tuple[list[str], list[list[str]]]:
+        """
+        X and V as lists of str, the types they have if loaded in non-numeric mode.
+
+        The lists are generated on each call from the stored arrays with str(), so
+        they hold the representation of the parsed numbers, e.g. "0.0" or "-9999.0",
+        not the tokens of the file (e.g. "0" or "-9999"). Compare values, not str,
+        with a non-numeric read of the same file.
+        """
+        if not isinstance(self.X, np.ndarray):
+            return self.X, self.V
+        return np.asarray(self.X).astype(str).tolist(), np.asarray(self.V).astype(str).tolist()
+
+    def to_arrays(self, dtype=np.float64) -> tuple[np.ndarray, np.ndarray]:
+        """
+        X and V as numeric arrays with shapes (n_rows,) and (NV, n_rows).
+
+        Arrays are returned as stored if loaded in numeric mode or created with
+        from_arrays; lists of str are converted, None becomes NaN.
+        """
+        if isinstance(self.X, np.ndarray) and isinstance(self.V, np.ndarray):
+            return self.X, self.V
+        x = np.asarray(self.X, dtype=dtype)
+        v = np.array(
+            [[np.nan if s is None else s for s in col] for col in self.V], dtype=dtype, ndmin=2
+        )
+        return x, v
+
     # ------------------------------------------------------------------------------
     def __repr__(self) -> str:
         s = f"NASA Ames {self.FFI}\n---\n"
         s += "".join(
             [
-                f"{k.strip('_')} : {self.__dict__[k]}\n"
+                f"{k.strip('_')} : {getattr(self, k)}\n"
                 for k in (
                     "_SRC",
                     "NLHEAD",
@@ -238,6 +711,8 @@ KEYS = [
     "_V",
     "_SRC",
     "_HEADER",
+    "_DATA",
+    "_FORMATS",
 ]
 
 
@@ -252,52 +727,67 @@ def na1001_cls_read(
     vmiss_to_None=False,
     ensure_ascii=True,
     allow_emtpy_data=False,
+    numeric=False,
+    dtype=np.float64,
+    lazy=False,
+    memory_map=False,
+    header_only=False,
+    variables=None,
+    workers=1,
+    validate="full",
+    physical=None,
 ):
     """
     Read NASA Ames 1001 formatted text file. Expected encoding is ASCII.
 
     See class method for detailled docstring.
     """
-    na_1001 = {}
-    if hasattr(file, "read"):  # if it has a read method, assume buffered IO
+    if validate not in ("none", "header", "full"):
+        raise ValueError(f"validate must be 'none', 'header' or 'full', got '{validate}'")
+    if physical not in (None, "nan", "mask"):
+        raise ValueError(f"physical must be None, 'nan' or 'mask', got '{physical}'")
+    check_header = validate != "none"
+
+    na_1001 = {"_DATA": None, "_FORMATS": None}
+    owns_buf = False
+    if header_only:  # data block is not read at all
+        allow_emtpy_data, lazy, memory_map = True, False, False
+
+    if isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):  # use buffer as-is
+        na_1001["_SRC"] = "bytes"
+        data = file.cast("B") if isinstance(file, memoryview) else file
+        if header_only:
+            data = data[: _find_data_start(data)]
+    elif hasattr(file, "read"):  # if it has a read method, assume buffered IO
         na_1001["_SRC"] = "BaseIO"
-        data = file.read()
+        data = _read_header(file) if header_only else file.read()
         if not isinstance(data, bytes):
             data = bytes(data, "utf-8")
     else:
         file = Path(file)
         na_1001["_SRC"] = file.as_posix()
+        # parallel parsing re-opens the file in the workers; the parent only needs
+        # the line boundaries, so the file is mapped instead of read
+        parallel = workers > 1 and (numeric or lazy or physical is not None)
         with open(file, "rb") as f:
-            data = f.read()
-
-    # by definition, NASA Ames 1001 is pure ASCII. the following lines allow
-    # to read files with other encodings; use with caution
-    encodings = ("ascii",) if ensure_ascii else ("ascii", "utf-8", "cp1252", "latin-1")
-
-    decoded = False
-    for enc in encodings:
-        try:
-            decoded = data.decode(enc)
-        except ValueError:  # invalid encoding, try next
-            pass
-        else:
-            if enc != "ascii":
-                print(f"warning: non-ascii encoding '{enc}' used in file {na_1001['SRC']}")
-            break  # found a working encoding
-    if not decoded:
-        raise ValueError(f"could not decode input (ASCII-only: {ensure_ascii})")
-
-    file_content = decoded.split("\n")
-
-    if strip_lines:
-        for i, line in enumerate(file_content):
-            file_content[i] = line.strip()
-
-    if rmv_repeated_seps:
-        for i, line in enumerate(file_content):
-            while sep + sep in line:
-                line = line.replace(sep + sep, sep)
-            file_content[i] = line
+            if header_only:
+                data = _read_header(f)
+            elif (memory_map or parallel) and os.fstat(f.fileno()).st_size:
+                data, owns_buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), True
+            else:
+                data = f.read()
+
+    lazy = lazy or memory_map
+    numeric = numeric or lazy or physical is not None
+    if numeric and rmv_repeated_seps:
+        raise ValueError("rmv_repeated_seps is not supported in numeric mode, use sep_data=None")
+    if numeric and vmiss_to_None:
+        raise ValueError("vmiss_to_None is not supported in numeric mode, use physical='nan'")
+    # header and data block are processed separately; in numeric mode,
+    # the data block is never decoded but handed to numpy as bytes
+    buf, data_start = data, _find_data_start(data)
+    file_content = _decode(buf[:data_start], ensure_ascii, na_1001["_SRC"]).split("\n")
+    file_content = _prepare_lines(file_content, sep, strip_lines, rmv_repeated_seps)
 
     tmp = list(map(int, file_content[0].split()))
     assert len(tmp) == 2, f"invalid format in line 1: '{file_content[0]}'"
@@ -308,12 +798,15 @@ def na1001_cls_read(
     na_1001["NLHEAD"] = nlhead
 
     header = file_content[:nlhead]
-    data = file_content[nlhead:]
-    if all(x == "" for x in data) or data == ["\n"]:
-        data = None
+    if numeric:
+        data = True if _has_data(buf, data_start) else None
+    else:
+        data = _decode(buf[data_start:], ensure_ascii, na_1001["_SRC"])
+        if not data or data.isspace():
+            data = None
 
     if not allow_emtpy_data:
-        assert data, "no data found."
+        assert data is not None, "no data found."
 
     na_1001["ONAME"] = header[1]
     na_1001["ORG"] = header[2]
@@ -328,9 +821,10 @@ def na1001_cls_read(
     assert len(tmp) == 6, f"invalid format line 7: '{header[6]}'"
 
     # check for valid date in line 7 (yyyy mm dd)
-    assert date(*tmp[:3]) <= date(
-        *tmp[3:6]
-    ), f"RDATE must be greater or equal to DATE, have DATE {date(*tmp[:3])}, RDATE {date(*tmp[3:6])}"
+    if check_header:
+        assert date(*tmp[:3]) <= date(
+            *tmp[3:6]
+        ), f"RDATE must be greater or equal to DATE, have DATE {date(*tmp[:3])}, RDATE {date(*tmp[3:6])}"
     na_1001["DATE"], na_1001["RDATE"] = tmp[:3], tmp[3:6]
 
     # DX check if the line contains a decimal separator; if so use float else int
@@ -349,15 +843,16 @@ def na1001_cls_read(
         na_1001["VSCAL"] = header[10].split()
         na_1001["VMISS"] = header[11].split()
 
-    assert (
-        len(na_1001["VSCAL"]) == na_1001["NV"]
-    ), f"number of elements in VSCAL (have: {len(na_1001['VSCAL'])}) must match number of variables specified ({na_1001['NV']})"
-    assert (
-        len(na_1001["VMISS"]) == na_1001["NV"]
-    ), f"number of elements in VMISS (have: {len(na_1001['VMISS'])}) must match number of variables specified ({na_1001['NV']})"
-    assert (
-        n_vars == len(na_1001["VSCAL"]) == len(na_1001["VMISS"])
-    ), "VSCAL, VMISS and NV must have equal number of elements"
+    if check_header:
+        assert (
+            len(na_1001["VSCAL"]) == na_1001["NV"]
+        ), f"number of elements in VSCAL (have: {len(na_1001['VSCAL'])}) must match number of variables specified ({na_1001['NV']})"
+        assert (
+            len(na_1001["VMISS"]) == na_1001["NV"]
+        ), f"number of elements in VMISS (have: {len(na_1001['VMISS'])}) must match number of variables specified ({na_1001['NV']})"
+        assert (
+            n_vars == len(na_1001["VSCAL"]) == len(na_1001["VMISS"])
+        ), "VSCAL, VMISS and NV must have equal number of elements"
 
     na_1001["_VNAME"] = header[10 + offset : 10 + n_vars + offset]
 
@@ -369,7 +864,7 @@ def na1001_cls_read(
         na_1001["_SCOM"] = ""
 
     msg = "nscoml not equal n elements in list na_1001['_SCOM']"
-    assert nscoml == len(na_1001["_SCOM"]), msg
+    assert not check_header or nscoml == len(na_1001["_SCOM"]), msg
 
     # read normal comment if nncoml>0
     if auto_nncoml is True:
@@ -386,19 +881,82 @@ def na1001_cls_read(
         na_1001["_NCOM"] = ""
 
     msg = "nncoml not equal n elements in list na_1001['_NCOM']"
-    assert nncoml == len(na_1001["_NCOM"]), msg
+    assert not check_header or nncoml == len(na_1001["_NCOM"]), msg
 
     msg = "nlhead must be equal to nncoml + nscoml + n_vars + 14"
-    assert nncoml + nscoml + n_vars + 14 == nlhead, msg
+    assert not check_header or nncoml + nscoml + n_vars + 14 == nlhead, msg
 
     # done with header, we can set HEADER variable now
     na_1001["_HEADER"] = header
 
+    if sep_data == "auto":
+        sep_data = _detect_sep_data(
+            _as_bytes(buf[data_start : data_start + _HEADER_SIZE]), n_vars + 1
+        )
+
+    # reduce to selected variables; X is always loaded
+    cols = list(range(n_vars))
+    if variables is not None:
+        cols = _select_columns(variables, na_1001["_VNAME"])
+        for k in ("VSCAL", "VMISS", "_VNAME"):
+            na_1001[k] = [na_1001[k][j] for j in cols]
+        na_1001["NV"] = len(cols)
+        na_1001["NLHEAD"] -= n_vars - len(cols)
+
     # continue with variables
-    na_1001["_X"] = []  # holds independent variable
-    na_1001["_V"] = [[] for _ in range(n_vars)]  # list for each dependent variable
+    if numeric:
+        usecols = None if variables is None else [0] + [j + 1 for j in cols]
+        block = _DataBlock(
+            buf,
+            data_start,
+            len(cols) + 1,
+            sep_data,
+            dtype,
+            owns_buf=owns_buf,
+            usecols=usecols,
+            path=file if isinstance(file, Path) else None,
+            workers=workers,
+            physical=physical,
+            vscal=na_1001["VSCAL"],
+            vmiss=na_1001["VMISS"],
+        )
+        if lazy:  # parsed on first access of X, V or a single variable
+            na_1001["_X"], na_1001["_V"], na_1001["_DATA"] = None, None, block
+        else:
+            na_1001["_X"], na_1001["_V"] = block.columns()
+        if physical is not None:  # V is scaled, the block keeps the original VSCAL
+            na_1001["VSCAL"] = ["1"] * len(cols)
+        return na_1001
 
-    if data is not None:
+    na_1001["_X"] = []  # holds independent variable
+    na_1001["_V"] = [[] for _ in cols]  # list for each dependent variable
+
+    n_cols = n_vars + 1
+    if data is not None and sep_data is None:
+        # values separated by any run of whitespace; tokenize the whole block at once
+        if validate != "full":
+            tokens = data.split()
+            _check_n_tokens(tokens, n_cols)
+        else:
+            tokens = []
+            for ix, line in enumerate(data.split("\n")):
+                parts = line.split()
+                assert (
+                    not parts or len(parts) == n_cols
+                ), f"invalid number of parameters in line {ix+nlhead+1}, have {len(parts)} ({parts}), want {n_cols}"
+                tokens += parts
+        _columns_from_tokens(na_1001, tokens, n_cols, cols, vmiss_to_None)
+
+    elif data is not None and validate != "full":
+        # trusted input: no per-line checks or stripping, one shape check for the block
+        if "\r" in data:
+            data = data.replace("\r\n", "\n")
+        tokens = data.strip().replace("\n", sep_data).split(sep_data)
+        _check_n_tokens(tokens, n_cols)
+        _columns_from_tokens(na_1001, tokens, n_cols, cols, vmiss_to_None)
+
+    elif data is not None:
+        data = _prepare_lines(data.split("\n"), sep, strip_lines, rmv_repeated_seps)
         for ix, line in enumerate(data):
             if line == "" or line == "\n":  # skip empty lines or trailing newline
                 continue
@@ -410,19 +968,787 @@ def na1001_cls_read(
 
             na_1001["_X"].append(parts[0].strip())
             if vmiss_to_None:
-                for j in range(n_vars):
+                for j, col in enumerate(cols):
                     na_1001["_V"][j].append(
-                        parts[j + 1].strip()
-                        if parts[j + 1].strip() != na_1001["VMISS"][j]
+                        parts[col + 1].strip()
+                        if parts[col + 1].strip() != na_1001["VMISS"][j]
                         else None
                     )
             else:
-                for j in range(n_vars):
-                    na_1001["_V"][j].append(parts[j + 1].strip())
+                for j, col in enumerate(cols):
+                    na_1001["_V"][j].append(parts[col + 1].strip())
 
     return na_1001
 
 
+def na1001_iter_chunks(
+    file, rows=100_000, sep_data="\t", dtype=np.float64, variables=None, physical=None, **kwargs
+):
+    """
+    Read the data block of a NASA Ames 1001 file in chunks of at most rows lines.
+
+    See class method for detailled docstring.
+    """
+    args = (rows, sep_data, dtype, variables, physical)
+    if isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
+        yield from _iter_file_chunks(io.BytesIO(file), *args, **kwargs)
+    elif hasattr(file, "read"):
+        yield from _iter_file_chunks(file, *args, **kwargs)
+    else:
+        with open(file, "rb") as f:
+            yield from _iter_file_chunks(f, *args, **kwargs)
+
+
+def _iter_file_chunks(f, rows, sep_data, dtype, variables, physical, **kwargs):
+    """Chunk iterator on an open file."""
+    # header is parsed once, then the file is consumed line by line
+    na_1001 = na1001_cls_read(
+        _read_header(f),
+        sep_data=sep_data,
+        numeric=True,
+        dtype=dtype,
+        allow_emtpy_data=True,
+        **_header_options(kwargs, "iter_chunks"),
+    )
+    n_cols = na_1001["NV"] + 1
+    usecols, vscal, vmiss = _column_selection(na_1001, variables)
+    while True:
+        lines = list(islice(f, rows))
+        if not lines:
+            break
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            continue
+        if sep_data == "auto":
+            sep_data = _detect_sep_data(lines[0], n_cols)
+        arr = np.loadtxt(
+            lines, delimiter=sep_data, comments=None, dtype=dtype, ndmin=2, usecols=usecols
+        )
+        if not arr.size:
+            continue
+        n_want = n_cols if usecols is None else len(usecols)
+        assert (
+            arr.shape[1] == n_want
+        ), f"invalid number of parameters in data block, have {arr.shape[1]}, want {n_want}"
+        yield _split_columns(arr, physical, vscal, vmiss)
+
+
+def na1001_read_rows(
+    file,
+    start=0,
+    stop=None,
+    sep_data="\t",
+    dtype=np.float64,
+    variables=None,
+    physical=None,
+    **kwargs,
+):
+    """
+    Read rows start to stop of a fixed-width NASA Ames 1001 file.
+
+    See class method for detailled docstring.
+    """
+    with open(file, "rb") as f:
+        na_1001 = na1001_cls_read(
+            _read_header(f),
+            numeric=True,
+            allow_emtpy_data=True,
+            **_header_options(kwargs, "read_rows"),
+        )
+        data_start = f.tell()
+        line_len = len(f.readline())
+        size = f.seek(0, os.SEEK_END)
+        n_rows = (size - data_start) // line_len if line_len else 0
+        if line_len and (size - data_start) % line_len:
+            raise ValueError(f"{file} has data lines of different length, not fixed-width")
+
+        start, stop, _ = slice(start, stop).indices(n_rows)
+        n = max(stop - start, 0)
+        f.seek(data_start + start * line_len)
+        block = f.read(n * line_len)
+
+    usecols, vscal, vmiss = _column_selection(na_1001, variables)
+    n_cols = na_1001["NV"] + 1 if usecols is None else len(usecols)
+    if n and not (np.frombuffer(block, np.uint8)[line_len - 1 :: line_len] == ord("\n")).all():
+        raise ValueError(f"{file} has data lines of different length, not fixed-width")
+    arr = _parse_data_numeric(block, 0, sep_data, dtype, usecols)
+    if not arr.size:
+        arr = np.empty((0, n_cols), dtype=dtype)
+    assert (
+        arr.shape[1] == n_cols
+    ), f"invalid number of parameters in data block, have {arr.shape[1]}, want {n_cols}"
+    return _split_columns(arr, physical, vscal, vmiss)
+
+
+def _header_options(kwargs: dict, caller: str, also=()) -> dict:
+    """
+    kwargs for the reader of a header that is parsed on its own; options that only
+    apply to reading the data block in na1001_cls_read, and those in also, are rejected.
+    """
+    unsupported = sorted(
+        set(kwargs)
+        & {"numeric", "lazy", "memory_map", "workers", "allow_emtpy_data", "header_only", *also}
+    )
+    if unsupported:
+        raise TypeError(f"{caller} got unsupported keyword arguments {unsupported}")
+    return kwargs
+
+
+def _column_selection(na_1001: dict, variables) -> tuple[list, list[str], list[str]]:
+    """usecols for the numeric parser (None for all) and VSCAL, VMISS of the selection."""
+    cols = list(range(na_1001["NV"]))
+    usecols = None
+    if variables is not None:
+        cols = _select_columns(variables, na_1001["_VNAME"])
+        usecols = [0] + [j + 1 for j in cols]
+    return usecols, [na_1001["VSCAL"][j] for j in cols], [na_1001["VMISS"][j] for j in cols]
+
+
+class NA1001Follower(object):
+    r"""
+    Follow a NASA Ames 1001 file that is being appended to, e.g. by acquisition software.
+
+    The header is parsed once; each poll parses only the complete lines appended
+    since the previous poll. The byte offset after the last complete line is kept
+    in offset, a trailing partial line is left for the next poll.
+
+    >>> with NA1001Follower("data.na") as f:
+    ...     for x, v in f.follow(interval=1.0):
+    ...         ...
+
+    Parameters
+    ----------
+    file : str or pathlib.Path
+        file to follow.
+    sep_data : str, optional
+        Delimiter used in data block; "auto" is resolved on the first data line.
+        The default is "\t".
+    dtype : numpy dtype, optional
+        Data type of the numeric arrays. The default is np.float64.
+    variables : list of str or int, optional
+        Only parse these dependent variables. The default is None (all).
+    physical : str, optional
+        "nan" or "mask", see FFI1001. The default is None (raw values).
+    **kwargs
+        Passed on to the header reader, see FFI1001 class docstring; options that apply
+        to the complete data block (numeric, lazy, memory_map, workers,
+        allow_emtpy_data, header_only) raise TypeError.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, Path],
+        sep_data="\t",
+        dtype=np.float64,
+        variables=None,
+        physical=None,
+        **kwargs,
+    ):
+        self.path = Path(file)
+        self.sep_data, self.dtype, self.physical = sep_data, dtype, physical
+        self._file = open(self.path, "rb")  # noqa: SIM115
+        self.header = na1001_cls_read(
+            _read_header(self._file),
+            numeric=True,
+            allow_emtpy_data=True,
+            **_header_options(kwargs, "NA1001Follower"),
+        )
+        self.offset = self._file.tell()
+        self._n_cols = self.header["NV"] + 1
+        self._usecols, self._vscal, self._vmiss = _column_selection(self.header, variables)
+        if self._usecols is not None:
+            self._n_cols = len(self._usecols)
+
+    def poll(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Parse complete lines appended since the last poll.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            X with shape (n_rows,) and V with shape (NV, n_rows); n_rows may be 0.
+
+        """
+        self._file.seek(self.offset)
+        new = self._file.read()
+        end = new.rfind(b"\n") + 1  # only complete lines
+        arr = np.empty((0, self._n_cols), dtype=self.dtype)
+        if end:
+            if self.sep_data == "auto":
+                self.sep_data = _detect_sep_data(new[: new.find(b"\n")], self._n_cols)
+            parsed = _parse_data_numeric(new, 0, self.sep_data, self.dtype, self._usecols, end)
+            self.offset += end
+            if parsed.size:
+                assert (
+                    parsed.shape[1] == self._n_cols
+                ), f"invalid number of parameters in data block, have {parsed.shape[1]}, want {self._n_cols}"
+                arr = parsed
+        return _split_columns(arr, self.physical, self._vscal, self._vmiss)
+
+    def follow(
+        self, interval: float = 1.0, timeout=None
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Poll every interval seconds and yield X, V whenever new rows arrived.
+
+        Stops after timeout seconds without new rows; the default None never stops.
+        """
+        idle = 0.0
+        while timeout is None or idle < timeout:
+            x, v = self.poll()
+            if x.size:
+                idle = 0.0
+                yield x, v
+                continue
+            time.sleep(interval)
+            idle += interval
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "NA1001Follower":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def na1001_read_many(
+    paths,
+    workers=1,
+    sep_data="\t",
+    dtype=np.float64,
+    variables=None,
+    physical=None,
+    **kwargs,
+):
+    """
+    Read multiple NASA Ames 1001 files into one preallocated array.
+
+    See class method for detailled docstring.
+    """
+    paths = [Path(p) for p in paths]
+    assert paths, "no files given."
+    kwargs = _header_options(kwargs, "read_many")
+
+    # first pass: headers and number of data lines, to size the output
+    scan = partial(_scan_file, sep_data=sep_data, **kwargs)
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as ex:
+            scans = list(ex.map(scan, paths))
+    else:
+        scans = [scan(p) for p in paths]
+
+    na_1001 = scans[0][0]
+    for p, (head, *_) in zip(paths[1:], scans[1:]):
+        if head["_VNAME"] != na_1001["_VNAME"]:
+            raise ValueError(f"VNAME of {p} differs from {paths[0]}")
+        if physical is not None and (head["VSCAL"], head["VMISS"]) != (
+            na_1001["VSCAL"],
+            na_1001["VMISS"],
+        ):
+            raise ValueError(f"VSCAL or VMISS of {p} differ from {paths[0]}")
+
+    cols = list(range(na_1001["NV"]))
+    if variables is not None:
+        cols = _select_columns(variables, na_1001["_VNAME"])
+    usecols = [0] + [j + 1 for j in cols]
+
+    bounds = np.cumsum([0] + [n_lines for _, _, n_lines, _ in scans]).tolist()
+    shape = (bounds[-1], len(usecols))
+    tasks = [
+        (a, b, p, start, sep)
+        for a, b, p, (_, start, _, sep) in zip(bounds, bounds[1:], paths, scans)
+    ]
+
+    # second pass: each file is parsed directly into its slice of the output
+    if workers > 1:
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        )
+        try:
+            with ProcessPoolExecutor(workers) as ex:
+                futures = [
+                    ex.submit(
+                        _parse_into_shared, shm.name, shape, dtype, a, b, p, start, sep, usecols
+                    )
+                    for a, b, p, start, sep in tasks
+                ]
+                n_parsed = [f.result() for f in futures]
+        except BaseException:
+            shm.close()
+            raise
+        finally:
+            shm.unlink()  # the mapping stays valid until closed
+        # no copy: the result stays in shared memory, which is closed with the last view on it
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        weakref.finalize(out, shm.close)
+    else:
+        out = np.empty(shape, dtype=dtype)
+        n_parsed = [
+            _parse_file_into(out[a:b], p, start, sep, usecols) for a, b, p, start, sep in tasks
+        ]
+
+    if sum(n_parsed) < shape[0]:  # empty lines were counted but not parsed
+        out = np.concatenate([out[a : a + n] for a, n in zip(bounds, n_parsed)])
+
+    if variables is not None:
+        for k in ("VSCAL", "VMISS", "_VNAME"):
+            na_1001[k] = [na_1001[k][j] for j in cols]
+        na_1001["NLHEAD"] -= na_1001["NV"] - len(cols)
+        na_1001["NV"] = len(cols)
+
+    na_1001["_SRC"] = [p.as_posix() for p in paths]
+    na_1001["_X"], na_1001["_V"] = _split_columns(out, physical, na_1001["VSCAL"], na_1001["VMISS"])
+    if physical is not None:  # V is scaled
+        na_1001["VSCAL"] = ["1"] * na_1001["NV"]
+    return na_1001
+
+
+def na1001_read_volumes(paths, workers=1, **kwargs):
+    """
+    Read the volumes of a NASA Ames 1001 dataset into one dict.
+
+    See class method for detailled docstring.
+    """
+    kwargs = _header_options(kwargs, "read_volumes")
+    ivols = {}
+    for p in paths:
+        head = na1001_cls_read(p, header_only=True, **kwargs)
+        ivol = int(head["IVOL"])
+        if ivol in ivols:
+            raise ValueError(f"IVOL {ivol} of {p} duplicates {ivols[ivol][0]}")
+        ivols[ivol] = (p, int(head["NVOL"]))
+    nvols = {nvol for _, nvol in ivols.values()}
+    if len(nvols) != 1 or sorted(ivols) != list(range(1, nvols.pop() + 1)):
+        raise ValueError(f"volumes do not cover IVOL 1 to NVOL: {sorted(ivols)}")
+
+    na_1001 = na1001_read_many([ivols[i][0] for i in sorted(ivols)], workers, **kwargs)
+    na_1001["IVOL"], na_1001["NVOL"] = 1, 1
+    return na_1001
+
+
+def _scan_file(path, sep_data="\t", **kwargs) -> tuple[dict, int, int, str]:
+    """Header, data block offset, number of data lines and data delimiter of a file."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = _find_data_start(buf)
+        head = na1001_cls_read(buf[:start], header_only=True, **kwargs)
+        if sep_data == "auto":
+            sep_data = _detect_sep_data(buf[start : start + _HEADER_SIZE], head["NV"] + 1)
+        return head, start, _count_lines(buf, start, len(buf)), sep_data
+
+
+def _parse_file_into(out: np.ndarray, path, start: int, sep_data: str, usecols) -> int:
+    """Parse the data block of a file into out, return the number of rows."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return _parse_data_numeric(buf, start, sep_data, out.dtype, usecols, out=out).shape[0]
+
+
+def _parse_into_shared(shm_name: str, shape, dtype, a: int, b: int, *args) -> int:
+    """Parse a file into rows a:b of an array in shared memory; runs in a worker process."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        n = _parse_file_into(out[a:b], *args)
+        del out  # release the buffer before closing
+        return n
+    finally:
+        shm.close()
+
+
+_BLOCK_SIZE = 2**24  # bytes of data block handed to the numeric parser at once
+_HEADER_SIZE = 2**16  # bytes initially read to find the end of the header
+_WRITE_SIZE = 2**22  # characters of the data block written at once
+_WRITE_ROWS = 50_000  # rows per block formatted by one worker process
+
+
+def _x_spacing(x) -> dict:
+    """Step statistics of x from one pass over its differences, see FFI1001.x_spacing."""
+    # rounded once, so that min, max and the gaps agree on ties
+    steps = np.diff(np.asarray(x, dtype=float)).round(4)
+    if not steps.size:
+        return {"dx": 0, "min": None, "max": None, "regular": False, "n_gaps": 0, "gaps": []}
+    lo, hi = float(steps.min()), float(steps.max())
+    regular = lo == hi
+    gaps = [] if regular else np.flatnonzero(steps > lo).tolist()
+    dx = lo if regular else 0
+    # use an integer if dx is close to its integer value, else float:
+    dx = int(dx) if np.isclose(dx, int(dx)) else dx
+    return {"dx": dx, "min": lo, "max": hi, "regular": regular, "n_gaps": len(gaps), "gaps": gaps}
+
+
+def _decode(data: bytes, ensure_ascii: bool, src: str) -> str:
+    """Decode raw file content, ASCII unless ensure_ascii is False."""
+    if not hasattr(data, "decode"):  # memoryview, mmap
+        data = bytes(data)
+    # by definition, NASA Ames 1001 is pure ASCII. the following lines allow
+    # to read files with other encodings; use with caution
+    encodings = ("ascii",) if ensure_ascii else ("ascii", "utf-8", "cp1252", "latin-1")
+
+    for enc in encodings:
+        try:
+            decoded = data.decode(enc)
+        except ValueError:  # invalid encoding, try next
+            pass
+        else:
+            if enc != "ascii":
+                print(f"warning: non-ascii encoding '{enc}' used in file {src}")
+            return decoded  # found a working encoding
+
+    raise ValueError(f"could not decode input (ASCII-only: {ensure_ascii})")
+
+
+def _as_bytes(buf) -> bytes:
+    """bytes from a slice of a bytes-like object; only memoryview slices need a copy."""
+    return buf.tobytes() if isinstance(buf, memoryview) else buf
+
+
+def _check_n_tokens(tokens: list[str], n_cols: int):
+    """Shape check for a bulk-tokenized data block."""
+    assert (
+        len(tokens) % n_cols == 0
+    ), f"invalid number of parameters in data block, {len(tokens)} values do not fit {n_cols} columns"
+
+
+def _columns_from_tokens(
+    na_1001: dict, tokens: list[str], n_cols: int, cols: list[int], vmiss_to_None: bool
+):
+    """Set X and V from the flat list of all values in the data block."""
+    na_1001["_X"] = tokens[0::n_cols]
+    for j, col in enumerate(cols):
+        na_1001["_V"][j] = tokens[col + 1 :: n_cols]
+        if vmiss_to_None:
+            vmiss = na_1001["VMISS"][j]
+            na_1001["_V"][j] = [None if v == vmiss else v for v in na_1001["_V"][j]]
+
+
+def _prepare_lines(lines: list[str], sep: str, strip_lines: bool, rmv_repeated_seps: bool):
+    """Apply the line cleanup options of the reader."""
+    if strip_lines:
+        for i, line in enumerate(lines):
+            lines[i] = line.strip()
+
+    if rmv_repeated_seps:
+        for i, line in enumerate(lines):
+            while sep + sep in line:
+                line = line.replace(sep + sep, sep)
+            lines[i] = line
+
+    return lines
+
+
+def _detect_sep_data(sample, n_cols: int):
+    """Tab if the first data line in sample has n_cols tab-delimited fields, else None."""
+    if isinstance(sample, str):
+        sample = sample.encode("utf-8")
+    for line in sample.split(b"\n"):
+        if line.strip():
+            return "\t" if len(line.strip().split(b"\t")) == n_cols else None
+    return "\t"
+
+
+def _select_columns(variables, vnames: list[str]) -> list[int]:
+    """Indices into V of the variables given by VNAME entry or index."""
+    cols = []
+    for v in variables:
+        if isinstance(v, str):
+            if v not in vnames:
+                raise ValueError(f"variable '{v}' not found in VNAME {vnames}")
+            cols.append(vnames.index(v))
+        else:
+            if not 0 <= v < len(vnames):
+                raise ValueError(f"variable index {v} out of range for NV={len(vnames)}")
+            cols.append(int(v))
+    return cols
+
+
+def _read_header(f) -> bytes:
+    """Read the NLHEAD header lines from an open file, which is left at the data block."""
+    lines = [f.readline()]
+    lines += [f.readline() for _ in range(int(lines[0].split()[0]) - 1)]
+    if isinstance(lines[0], str):  # text mode
+        return "".join(lines).encode("utf-8")
+    return b"".join(lines)
+
+
+def _find_data_start(buf) -> int:
+    """Byte offset of the first line after the NLHEAD header lines."""
+    size, end = _HEADER_SIZE, len(buf)
+    while True:
+        head = _as_bytes(buf[:size])
+        first = head.split(b"\n", 1)[0]
+        if len(first) == len(head) and size < end:  # first line incomplete, read more
+            size *= 4
+            continue
+        nlhead = int(first.split()[0])
+        lines = head.split(b"\n", nlhead)
+        if len(lines) > nlhead:  # all header lines are complete
+            return len(head) - len(lines[-1])
+        if size >= end:  # header-only input without trailing newline
+            return end
+        size *= 4
+
+
+def _count_lines(buf, start: int, stop: int) -> int:
+    """Number of lines in buf[start:stop], including a last line without newline."""
+    if start >= stop:
+        return 0
+    if hasattr(buf, "count"):
+        n = buf.count(b"\n", start, stop)
+    else:  # mmap, memoryview: count without copying the buffer
+        n = sum(
+            int(np.count_nonzero(np.frombuffer(buf, np.uint8, min(_BLOCK_SIZE, stop - i), i) == 10))
+            for i in range(start, stop, _BLOCK_SIZE)
+        )
+    return n + (_as_bytes(buf[stop - 1 : stop]) != b"\n")
+
+
+def _iter_blocks(buf, start: int, stop=None, block_size: int = _BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield consecutive parts of buf[start:stop], each ending on a complete line."""
+    stop = len(buf) if stop is None else stop
+    while start < stop:
+        block = _as_bytes(buf[start : min(start + block_size, stop)])
+        end = block.rfind(b"\n") + 1
+        while not end and start + len(block) < stop:  # line longer than block_size
+            block += _as_bytes(buf[start + len(block) : min(start + len(block) + block_size, stop)])
+            end = block.rfind(b"\n") + 1
+        if end and start + len(block) < stop:
+            block = block[:end]
+        yield block
+        start += len(block)
+
+
+def _has_data(buf, start: int) -> bool:
+    """Check if anything but whitespace follows the header."""
+    return bool(_as_bytes(buf[start : start + _HEADER_SIZE]).strip())
+
+
+def _next_line_start(buf, pos: int, stop: int) -> int:
+    """Position after the next newline at or behind pos, stop if there is none."""
+    while pos < stop:
+        chunk = _as_bytes(buf[pos : min(pos + _HEADER_SIZE, stop)])
+        i = chunk.find(b"\n")
+        if i >= 0:
+            return pos + i + 1
+        pos += len(chunk)
+    return stop
+
+
+def _split_ranges(buf, start: int, stop: int, n: int) -> list[tuple[int, int]]:
+    """Split buf[start:stop] into at most n ranges of complete lines."""
+    bounds = [start]
+    for i in range(1, n):
+        pos = _next_line_start(buf, max(start + i * (stop - start) // n, bounds[-1]), stop)
+        if pos >= stop:
+            break
+        bounds.append(pos)
+    return list(zip(bounds, bounds[1:] + [stop]))
+
+
+def _parse_file_range(path, start: int, stop: int, sep_data: str, dtype, usecols) -> np.ndarray:
+    """Parse part of the data block of a file; runs in a worker process."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return _parse_data_numeric(buf, start, sep_data, dtype, usecols, stop)
+
+
+def _parse_data_parallel(
+    buf, start: int, sep_data: str, dtype, usecols, workers: int, path=None
+) -> np.ndarray:
+    """
+    Parse the data block buf[start:] in a pool of worker processes.
+
+    Workers re-open the file if a path is given; otherwise they get a copy
+    of their part of the buffer.
+    """
+    # a few ranges per worker to balance load, but at least one block each
+    n = min(workers * 4, (len(buf) - start) // _BLOCK_SIZE + 1)
+    if n < 2:
+        return _parse_data_numeric(buf, start, sep_data, dtype, usecols)
+
+    with ProcessPoolExecutor(workers) as ex:
+        futures = [
+            (
+                ex.submit(_parse_file_range, path, a, b, sep_data, dtype, usecols)
+                if path is not None
+                else ex.submit(
+                    _parse_data_numeric, _as_bytes(buf[a:b]), 0, sep_data, dtype, usecols
+                )
+            )
+            for a, b in _split_ranges(buf, start, len(buf), n)
+        ]
+        parts = [f.result() for f in futures]  # keeps order of ranges
+
+    parts = [p for p in parts if p.size]
+    if not parts:
+        return np.empty((0, 0), dtype=dtype)
+    assert (
+        len({p.shape[1] for p in parts}) == 1
+    ), f"invalid number of parameters in data block, have {sorted({p.shape[1] for p in parts})}"
+    return np.concatenate(parts)
+
+
+def _parse_data_numeric(
+    buf, start: int, sep_data: str, dtype, usecols=None, stop=None, out=None
+) -> np.ndarray:
+    """
+    Parse the data block buf[start:stop] to a 2-D array of shape (n_rows, n_columns).
+    If usecols is given, only these columns are converted.
+
+    The number of rows is taken from the number of newlines, so the output can
+    be allocated once and filled block by block. Alternatively, a large enough
+    output array can be passed as out.
+    """
+    stop = len(buf) if stop is None else stop
+    n_rows = _count_lines(buf, start, stop) if out is None else 0
+    filled = 0
+    for block in _iter_blocks(buf, start, stop):
+        arr = _loadtxt(block, sep_data, dtype, usecols)
+        if not arr.size:
+            continue
+        if out is None:
+            out = np.empty((n_rows, arr.shape[1]), dtype=dtype)
+        assert (
+            arr.shape[1] == out.shape[1]
+        ), f"invalid number of parameters in data block, have {arr.shape[1]}, want {out.shape[1]}"
+        out[filled : filled + arr.shape[0]] = arr
+        filled += arr.shape[0]
+
+    if out is None:
+        return np.empty((0, 0), dtype=dtype)
+    return out[:filled]  # empty lines are counted but not parsed
+
+
+_BLANK_LINE = re.compile(rb"^[ \t\r]+$", re.MULTILINE)
+
+
+def _loadtxt(block: bytes, sep_data: str, dtype, usecols) -> np.ndarray:
+    """
+    Parse a block of data lines with numpy. numpy only skips empty lines, so
+    whitespace-only lines are emptied and the block is parsed again if it fails.
+    """
+    kwargs = {"delimiter": sep_data, "comments": None, "dtype": dtype, "ndmin": 2}
+    try:
+        return np.loadtxt(io.BytesIO(block), usecols=usecols, **kwargs)
+    except ValueError:
+        if not _BLANK_LINE.search(block):
+            raise
+    return np.loadtxt(io.BytesIO(_BLANK_LINE.sub(b"", block)), usecols=usecols, **kwargs)
+
+
+def _split_columns(
+    arr: np.ndarray, physical=None, vscal=None, vmiss=None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    X and V as views on the row-major data block; V has shape (NV, n_rows).
+
+    If physical is set, V is scaled in place and VMISS is set to NaN or masked.
+    """
+    x, v = arr[:, 0], arr[:, 1:].T
+    if physical is None:
+        return x, v
+    return x, _to_physical(v, physical, vscal, vmiss)
+
+
+def _to_physical(v: np.ndarray, physical: str, vscal: list[str], vmiss: list[str]):
+    """Scale V of shape (NV, n_rows) in place; set VMISS to NaN or mask it."""
+    # one vectorized step for all variables; VMISS is compared as a number
+    # in the dtype of the data, so "-9999" and "-9999.0" are equivalent
+    scale = np.array(vscal, dtype=float).astype(v.dtype)[:, None]
+    missing = _is_vmiss(v, np.array(vmiss, dtype=float)[:, None])
+    v *= scale
+    if physical == "mask":
+        return np.ma.MaskedArray(v, mask=missing)
+    v[missing] = np.nan
+    return v
+
+
+def _is_vmiss(v: np.ndarray, vmiss) -> np.ndarray:
+    """Mask of values equal to vmiss, compared as numbers in the dtype of v if it is float."""
+    miss = np.asarray(vmiss, dtype=float)
+    if v.dtype.kind != "f":
+        return v == miss
+    miss = miss.astype(v.dtype)
+    return (v == miss) | (np.isnan(v) & np.isnan(miss))
+
+
+class _DataBlock(object):
+    """
+    Data block of a NASA Ames 1001 file as a view on the underlying buffer.
+
+    Nothing is parsed until the array is requested the first time.
+    """
+
+    def __init__(
+        self,
+        buf,
+        start: int,
+        n_cols: int,
+        sep_data: str,
+        dtype,
+        owns_buf=False,
+        usecols=None,
+        path=None,
+        workers=1,
+        physical=None,
+        vscal=None,
+        vmiss=None,
+    ):
+        self.buf, self.start, self.n_cols = buf, start, n_cols
+        self.sep_data, self.dtype, self.owns_buf = sep_data, dtype, owns_buf
+        self.usecols, self.path, self.workers = usecols, path, workers
+        self.physical, self.vscal, self.vmiss = physical, vscal, vmiss
+        self._array = None
+        self._columns = {}  # memoized single columns
+
+    def _parse(self, usecols) -> np.ndarray:
+        """Parse the given columns of the data block."""
+        if self.workers > 1:
+            return _parse_data_parallel(
+                self.buf, self.start, self.sep_data, self.dtype, usecols, self.workers, self.path
+            )
+        return _parse_data_numeric(self.buf, self.start, self.sep_data, self.dtype, usecols)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Parsed data block, shape (n_rows, n_columns)."""
+        if self._array is None:
+            arr = self._parse(self.usecols)
+            if not arr.size:
+                arr = np.empty((0, self.n_cols), dtype=self.dtype)
+            assert (
+                arr.shape[1] == self.n_cols
+            ), f"invalid number of parameters in data block, have {arr.shape[1]}, want {self.n_cols}"
+            self._array = arr
+            self._columns = {}
+            self.close()
+        return self._array
+
+    def column(self, j: int) -> np.ndarray:
+        """Column j of the data block (0 is X), parsed on first access and memoized."""
+        if self._array is not None:
+            return self._array[:, j]
+        if j not in self._columns:
+            arr = self._parse([j if self.usecols is None else self.usecols[j]])
+            col = arr[:, 0] if arr.size else np.empty(0, dtype=self.dtype)
+            if j > 0 and self.physical is not None:
+                col = _to_physical(
+                    col[None, :], self.physical, self.vscal[j - 1 : j], self.vmiss[j - 1 : j]
+                )[0]
+            self._columns[j] = col
+        return self._columns[j]
+
+    def columns(self) -> tuple[np.ndarray, np.ndarray]:
+        """Parse and split into X and V; call only once, as V may be scaled in place."""
+        return _split_columns(self.array, self.physical, self.vscal, self.vmiss)
+
+    def close(self):
+        """Release the underlying buffer if it was opened by the reader."""
+        if self.owns_buf:
+            self.buf.close()
+        self.buf = None
+
+
 ###############################################################################
 
 
@@ -433,6 +1759,11 @@ def na1001_cls_write(
     sep_data="\t",
     overwrite=0,
     verbose=False,
+    formats=None,
+    x_format=None,
+    fixed_width=False,
+    workers=1,
+    header=None,
 ):
     """
     Write content of na1001 class instance to file in NASA Ames 1001 format. Encoding is ASCII.
@@ -455,6 +1786,285 @@ def na1001_cls_write(
         write = 2  # overwriting
     write = 1  # normal writing
 
+    _prepare_write(na_1001, verboseprint, formats, x_format)
+    head = _render_header(na_1001, sep) if header is None else header.render(na_1001)
+
+    if fixed_width:
+        _write_fixed_width(file_path, na_1001, head, sep_data, workers)
+        return write
+
+    # begin the actual writing process
+    with open(file_path, "w", encoding="ascii") as file_obj:
+        file_obj.write(head)
+        if workers > 1:
+            file_obj.writelines(_iter_formatted_parallel(na_1001, sep_data, _WRITE_ROWS, workers))
+        else:
+            file_obj.writelines(
+                _iter_formatted(
+                    na_1001["_X"], na_1001["_V"], na_1001["VMISS"], na_1001["_FORMATS"], sep_data
+                )
+            )
+
+    return write
+
+
+def _write_fixed_width(file_path, na_1001: dict, head: str, sep_data: str, workers: int):
+    """
+    Write na_1001 with all values of a column right-aligned to the same width, so
+    that all data lines have the same length. The file is preallocated; with
+    workers > 1, row ranges are formatted and written to it in parallel via mmap.
+    """
+    x, v = na_1001["_X"], na_1001["_V"]
+    n_rows = len(x)
+    n_parts = min(workers * 4, n_rows) if workers > 1 else 1
+    bounds = np.linspace(0, n_rows, n_parts + 1).round().astype(int).tolist()
+    ranges = [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+    xs = [x[a:b] for a, b in ranges]
+    vs = [[v_j[a:b] for v_j in v] for a, b in ranges]
+    kwargs = {"vmiss": na_1001["VMISS"], "formats": na_1001["_FORMATS"]}
+
+    header = head.encode("ascii")
+    ex = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        mapper = ex.map if ex else map
+        # widths need a pass over all values before any row can be placed
+        widths = [0] * (len(v) + 1)
+        for w in mapper(partial(_range_widths, **kwargs), xs, vs):
+            widths = [max(w0, w1) for w0, w1 in zip(widths, w)]
+        line_len = sum(widths) + len(sep_data) * len(v) + 1
+
+        with open(file_path, "wb") as file_obj:
+            file_obj.write(header)
+            file_obj.truncate(len(header) + n_rows * line_len)
+
+        offsets = [len(header) + a * line_len for a, _ in ranges]
+        write = partial(_write_fixed_range, file_path, widths=widths, sep_data=sep_data, **kwargs)
+        list(mapper(write, offsets, xs, vs))
+    finally:
+        if ex:
+            ex.shutdown()
+
+
+def _range_widths(x, v, vmiss, formats) -> list[int]:
+    """Maximum length of the formatted values of each column."""
+    return [max(map(len, col), default=0) for col in _data_columns(x, v, vmiss, formats)]
+
+
+def _write_fixed_range(path, offset: int, x, v, vmiss, formats, widths, sep_data) -> int:
+    """Write padded rows to the preallocated region of file path starting at offset."""
+    cols = _data_columns(x, v, vmiss, formats)
+    cols = [[s.rjust(w) for s in col] for col, w in zip(cols, widths)]
+    data = "".join(_iter_data_chunks(cols, sep_data)).encode("ascii")
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as buf:
+        buf[offset : offset + len(data)] = data
+    return len(data)
+
+
+def na1001_write_volumes(
+    file_path,
+    na_1001,
+    max_rows=None,
+    max_bytes=None,
+    workers=1,
+    sep=" ",
+    sep_data="\t",
+    overwrite=0,
+    verbose=False,
+    formats=None,
+    x_format=None,
+    header=None,
+):
+    """
+    Write content of na1001 class instance to NASA Ames 1001 files of limited size.
+
+    See class method to_volumes for detailled docstring.
+    """
+    if (max_rows is None) == (max_bytes is None):
+        raise ValueError("specify either max_rows or max_bytes")
+    verboseprint = print if verbose else lambda *a, **k: None
+    _prepare_write(na_1001, verboseprint, formats, x_format)
+    x, v = na_1001["_X"], na_1001["_V"]
+    n_rows = len(x)
+
+    texts = None  # formatted blocks of _WRITE_ROWS rows, if sized by max_bytes
+    if max_rows is not None:
+        bounds = list(range(0, n_rows, max_rows)) + [n_rows]
+    else:
+        # the header is longest with the most digits in IVOL and NVOL
+        longest = dict(na_1001, IVOL=n_rows, NVOL=n_rows)
+        head = _render_header(longest, sep) if header is None else header.render(longest)
+        budget = max_bytes - len(head) - head.count("\n") * (len(os.linesep) - 1)
+        blocks = [(a, min(a + _WRITE_ROWS, n_rows)) for a in range(0, n_rows, _WRITE_ROWS)]
+        lengths = partial(
+            _line_lengths, vmiss=na_1001["VMISS"], formats=na_1001["_FORMATS"], sep_data=sep_data
+        )
+        args = ([x[a:b] for a, b in blocks], [[v_j[a:b] for v_j in v] for a, b in blocks])
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as ex:
+                sized = list(ex.map(lengths, *args))
+        else:
+            sized = list(map(lengths, *args))
+        texts = [text for text, _ in sized]
+        # offsets of the data lines in the formatted text, and in bytes on disk
+        offsets = np.cumsum(np.concatenate([np.zeros(1, np.int64), *(n for _, n in sized)]))
+        cum = offsets + np.arange(n_rows + 1) * (len(os.linesep) - 1)
+        bounds = [0]
+        while bounds[-1] < n_rows:
+            b = int(np.searchsorted(cum, cum[bounds[-1]] + budget, side="right")) - 1
+            bounds.append(min(max(b, bounds[-1] + 1), n_rows))
+    if len(bounds) < 2:  # no data, one volume with the header only
+        bounds = [0, 0]
+
+    nvol = len(bounds) - 1
+    path = Path(file_path)
+    paths = [
+        path.with_name(f"{path.stem}_{i:0{len(str(nvol))}d}{path.suffix}")
+        for i in range(1, nvol + 1)
+    ]
+    if not overwrite and any(p.exists() for p in paths):
+        verboseprint(
+            f"write failed: volumes of {file_path} exist.\nset overwrite keyword to overwrite."
+        )
+        return []
+
+    if texts is not None:  # rows are formatted already, volumes are cut from the text
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for i, (p, a, b) in enumerate(zip(paths, bounds, bounds[1:])):
+            volume = dict(na_1001, IVOL=i + 1, NVOL=nvol)
+            with open(p, "w", encoding="ascii") as file_obj:
+                file_obj.write(
+                    _render_header(volume, sep) if header is None else header.render(volume)
+                )
+                file_obj.writelines(_text_rows(texts, offsets, a, b))
+        return paths
+
+    volumes = [
+        dict(na_1001, IVOL=i + 1, NVOL=nvol, _X=x[a:b], _V=[v_j[a:b] for v_j in v])
+        for i, (a, b) in enumerate(zip(bounds, bounds[1:]))
+    ]
+    write = partial(na1001_cls_write, sep=sep, sep_data=sep_data, overwrite=1, header=header)
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as ex:
+            list(ex.map(write, paths, volumes))
+    else:
+        list(map(write, paths, volumes))
+    return paths
+
+
+def _line_lengths(x, v, vmiss, formats, sep_data) -> tuple[str, np.ndarray]:
+    """Data lines of a block of rows and the length of each, including the "\\n"."""
+    text = _format_rows(x, v, vmiss, formats, sep_data)
+    eol = np.flatnonzero(np.frombuffer(text.encode("ascii"), np.uint8) == ord("\n"))
+    return text, np.diff(eol, prepend=-1)
+
+
+def _text_rows(texts: list[str], offsets: np.ndarray, a: int, b: int) -> Iterator[str]:
+    """Rows a to b from blocks of _WRITE_ROWS formatted rows; offsets are those of all rows."""
+    for k in range(a // _WRITE_ROWS, -(-b // _WRITE_ROWS)):
+        first = k * _WRITE_ROWS
+        start, stop = max(a, first), min(b, first + _WRITE_ROWS)
+        yield texts[k][offsets[start] - offsets[first] : offsets[stop] - offsets[first]]
+
+
+def na1001_iter_bytes(
+    na_1001,
+    chunk_rows=10_000,
+    sep=" ",
+    sep_data="\t",
+    verbose=False,
+    formats=None,
+    x_format=None,
+    workers=1,
+    header=None,
+):
+    """
+    Serialize content of na1001 class instance to ASCII-encoded chunks in NASA Ames 1001 format.
+
+    See class method for detailled docstring.
+    """
+    verboseprint = print if verbose else lambda *a, **k: None
+    _prepare_write(na_1001, verboseprint, formats, x_format)
+
+    head = _render_header(na_1001, sep) if header is None else header.render(na_1001)
+    yield head.encode("ascii")
+
+    if workers > 1:
+        for block in _iter_formatted_parallel(na_1001, sep_data, chunk_rows, workers):
+            yield block.encode("ascii")
+        return
+
+    for rows in _iter_formatted(
+        na_1001["_X"], na_1001["_V"], na_1001["VMISS"], na_1001["_FORMATS"], sep_data, chunk_rows
+    ):
+        yield rows.encode("ascii")
+
+
+def _format_rows(x, v, vmiss, formats, sep_data="\t") -> str:
+    """
+    Data lines of a block of rows as one str. If all columns are numeric arrays
+    with "d" or ".<n>f" formats, rows are assembled from the encoded bytes directly.
+    """
+    x_fmt, v_fmts = formats or (None, [None] * len(v))
+    cols = [(x, x_fmt, None)] + [(v[j], v_fmts[j], vmiss[j]) for j in range(len(v))]
+    if len(x) and all(_encodable(c, f) and len(c) == len(x) for c, f, _ in cols):
+        return _join_text([_encode_column(*c) for c in cols], sep_data)
+    return "".join(_iter_data_chunks(_data_columns(x, v, vmiss, formats), sep_data))
+
+
+def _iter_formatted(x, v, vmiss, formats, sep_data, chunk_rows=_WRITE_ROWS) -> Iterator[str]:
+    """Data lines in blocks of chunk_rows rows; lengths of X and V are checked first."""
+    _check_lengths(x, v)
+    return (
+        _format_rows(
+            x[a : a + chunk_rows], [v_j[a : a + chunk_rows] for v_j in v], vmiss, formats, sep_data
+        )
+        for a in range(0, len(x), chunk_rows)
+    )
+
+
+def _check_lengths(x, v):
+    """Raise ValueError if any V differs in length from X."""
+    for j, v_j in enumerate(v):
+        if len(v_j) != len(x):
+            raise ValueError(f"NA error: V[{j}] has {len(v_j)} values, X has {len(x)}!")
+
+
+def _numeric_lists(x, v) -> tuple:
+    """X and V with lists of numbers as arrays, so that formats and VMISS apply to them."""
+    return _as_numeric(x), [_as_numeric(v_j) for v_j in v]
+
+
+def _as_numeric(values):
+    """values as numpy array if they are numbers, else unchanged (e.g. lists of str)."""
+    if isinstance(values, np.ndarray):
+        return values
+    arr = np.asarray(values)
+    return arr if arr.dtype.kind in "fiu" else values
+
+
+def _iter_formatted_parallel(na_1001: dict, sep_data: str, chunk_rows: int, workers: int):
+    """
+    Data lines in blocks of chunk_rows, formatted in a process pool and yielded in
+    order. Up to 2 * workers blocks are in flight, so formatting continues while
+    the consumer writes and memory stays bounded.
+    """
+    x, v = na_1001["_X"], na_1001["_V"]
+    fmt = partial(
+        _format_rows, vmiss=na_1001["VMISS"], formats=na_1001["_FORMATS"], sep_data=sep_data
+    )
+    with ProcessPoolExecutor(workers) as ex:
+        pending = deque()
+        for a in range(0, len(x), chunk_rows):
+            b = a + chunk_rows
+            pending.append(ex.submit(fmt, x[a:b], [v_j[a:b] for v_j in v]))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _prepare_write(na_1001: dict, verboseprint, formats, x_format):
+    """Check and correct na_1001 before writing; formats override _FORMATS if given."""
     # check n variables and comment lines; adjust values if incorrect
     n_vars_named = len(na_1001["_VNAME"])
     n_vars_data = len(na_1001["_V"])
@@ -463,6 +2073,20 @@ def na1001_cls_write(
             "NA error: n vars in V and VNAME not equal, " f"{n_vars_data} vs. {n_vars_named}!"
         )
 
+    _check_lengths(na_1001["_X"], na_1001["_V"])
+    _correct_header(na_1001, verboseprint)
+
+    if formats is not None or x_format is not None:
+        x_fmt, v_fmts = na_1001.get("_FORMATS") or (None, None)
+        na_1001["_FORMATS"] = (
+            x_fmt if x_format is None else x_format,
+            _check_formats(v_fmts if formats is None else formats, na_1001["NV"]),
+        )
+
+
+def _correct_header(na_1001: dict, verboseprint):
+    """Set NV, NSCOML, NNCOML and NLHEAD from the content of na_1001 if incorrect."""
+    n_vars_named = len(na_1001["_VNAME"])
     if n_vars_named - na_1001["NV"] != 0:
         verboseprint("NA output: NV corrected")
         na_1001["NV"] = n_vars_named
@@ -482,92 +2106,491 @@ def na1001_cls_write(
         verboseprint("NA output: NLHEAD corrected")
         na_1001["NLHEAD"] = nlhead_is
 
-    # begin the actual writing process
-    with open(file_path, "w", encoding="ascii") as file_obj:
-        block = str(na_1001["NLHEAD"]) + sep + "1001\n"
-        file_obj.write(block)
-
-        block = str(na_1001["ONAME"]) + "\n"
-        file_obj.write(block)
-
-        block = str(na_1001["ORG"]) + "\n"
-        file_obj.write(block)
-
-        block = str(na_1001["SNAME"]) + "\n"
-        file_obj.write(block)
-
-        block = str(na_1001["MNAME"]) + "\n"
-        file_obj.write(block)
-
-        block = str(na_1001["IVOL"]) + sep + str(na_1001["NVOL"]) + "\n"
-        file_obj.write(block)
-
-        # dates: assume "yyyy m d" in tuple
-        block = (
-            "%4.4u" % na_1001["DATE"][0]
-            + sep
-            + "%2.2u" % na_1001["DATE"][1]
-            + sep
-            + "%2.2u" % na_1001["DATE"][2]
-            + sep
-            + "%4.4u" % na_1001["RDATE"][0]
-            + sep
-            + "%2.2u" % na_1001["RDATE"][1]
-            + sep
-            + "%2.2u" % na_1001["RDATE"][2]
-            + "\n"
-        )
-        file_obj.write(block)
 
-        file_obj.write(f"{na_1001['DX']}" + "\n")
+def _render_header(na_1001: dict, sep: str) -> str:
+    """NLHEAD header lines of na_1001 as one str."""
+    head, tail = _header_parts(na_1001, sep)
+    return head + _header_per_file(na_1001, sep) + tail
+
+
+def _header_parts(na_1001: dict, sep: str) -> tuple[str, str]:
+    """Header lines before IVOL/NVOL and after DX, i.e. the parts shared by files of a schema."""
+    out = []
+    block = str(na_1001["NLHEAD"]) + sep + "1001\n"
+    out.append(block)
 
-        # obsolete: CARIBIC
-        # file_obj.write(sep_com.join(na_1001["XNAME"]) + "\n")
-        file_obj.write(na_1001["XNAME"] + "\n")
+    block = str(na_1001["ONAME"]) + "\n"
+    out.append(block)
+
+    block = str(na_1001["ORG"]) + "\n"
+    out.append(block)
+
+    block = str(na_1001["SNAME"]) + "\n"
+    out.append(block)
 
-        n_vars = na_1001["NV"]  # get number of variables
-        block = str(n_vars) + "\n"
-        file_obj.write(block)
+    block = str(na_1001["MNAME"]) + "\n"
+    out.append(block)
+
+    head, out = "".join(out), []
+
+    # obsolete: CARIBIC
+    # out.append(sep_com.join(na_1001["XNAME"]) + "\n")
+    out.append(na_1001["XNAME"] + "\n")
+
+    n_vars = na_1001["NV"]  # get number of variables
+    block = str(n_vars) + "\n"
+    out.append(block)
+
+    line = ""
+    for i in range(n_vars):
+        line += str(na_1001["VSCAL"][i]) + sep
+    line = line[0:-1] if line.endswith("\n") else line[0:-1] + "\n"
+    out.append(line)
+
+    line = ""
+    for i in range(n_vars):
+        line += str(na_1001["VMISS"][i]) + sep
+    line = line[0:-1] if line.endswith("\n") else line[0:-1] + "\n"
+    out.append(line)
+
+    block = na_1001["_VNAME"]
+    for i in range(n_vars):
+        out.append(block[i] + "\n")
+
+    nscoml = na_1001["NSCOML"]  # get number of special comment lines
+    line = str(nscoml) + "\n"
+    out.append(line)
+
+    block = na_1001["_SCOM"]
+    for i in range(nscoml):
+        out.append(block[i] + "\n")
+
+    nncoml = na_1001["NNCOML"]  # get number of normal comment lines
+    line = str(nncoml) + "\n"
+    out.append(line)
+
+    block = na_1001["_NCOM"]
+    for i in range(nncoml):
+        out.append(block[i] + "\n")
+
+    return head, "".join(out)
+
+
+def _header_per_file(na_1001: dict, sep: str) -> str:
+    """Header lines IVOL/NVOL, DATE/RDATE and DX."""
+    out = []
+    block = str(na_1001["IVOL"]) + sep + str(na_1001["NVOL"]) + "\n"
+    out.append(block)
+
+    # dates: assume "yyyy m d" in tuple
+    block = (
+        "%4.4u" % na_1001["DATE"][0]
+        + sep
+        + "%2.2u" % na_1001["DATE"][1]
+        + sep
+        + "%2.2u" % na_1001["DATE"][2]
+        + sep
+        + "%4.4u" % na_1001["RDATE"][0]
+        + sep
+        + "%2.2u" % na_1001["RDATE"][1]
+        + sep
+        + "%2.2u" % na_1001["RDATE"][2]
+        + "\n"
+    )
+    out.append(block)
+
+    out.append(f"{na_1001['DX']}" + "\n")
+
+    return "".join(out)
+
+
+def _data_columns(x, v, vmiss: list[str], formats=None) -> list[list[str]]:
+    """X and all V as columns of str, formatted according to formats (see _FORMATS)."""
+    n_vars = len(v)
+    x_fmt, v_fmts = formats or (None, [None] * n_vars)
+    cols = [_format_column(x, x_fmt)]
+    cols += [_format_column(v[j], v_fmts[j], vmiss[j]) for j in range(n_vars)]
+    _check_lengths(cols[0], cols[1:])
+    return cols
+
+
+def _iter_data_chunks(
+    cols: list[list[str]], sep_data: str, size: int = _WRITE_SIZE
+) -> Iterator[str]:
+    """Lines of the data block, joined to chunks of about size characters."""
+    n_rows = len(cols[0])
+    if not n_rows:
+        return
+    line_len = len(sep_data.join(col[0] for col in cols)) + 1
+    step = max(1, size // line_len)
+    for a in range(0, n_rows, step):
+        rows = zip(*(col[a : a + step] for col in cols))
+        yield "\n".join(map(sep_data.join, rows)) + "\n"
+
+
+def _check_formats(formats, n_vars: int) -> list:
+    """One format spec per variable; a single spec or None applies to all."""
+    if isinstance(formats, str) or formats is None:
+        return [formats] * n_vars
+    if len(formats) != n_vars:
+        raise ValueError(f"need {n_vars} formats, got {len(formats)}")
+    return list(formats)
+
+
+def _format_column(values, fmt=None, vmiss=None) -> list[str]:
+    """
+    Values of one column as str. fmt only applies to numeric arrays, in which NaN,
+    masked values and values equal to vmiss are written as vmiss. Integer formats
+    round floats.
+    """
+    if not isinstance(values, np.ndarray):
+        return list(map(str, values))
+    text = _encode_column(values, fmt, vmiss)
+    if text is not None:
+        return _join_text([text], "\n").split("\n")[:-1]
+    data, missing = _column_data(values, fmt, vmiss)
+    if fmt is None and data.dtype.kind == "f" and data.dtype != np.float64:
+        # str() of a Python float would show the float64 value, e.g. 0.10000000149011612
+        strs = list(map(str, data))
+    else:  # one C-level call per value via the bound method of a template
+        strs = list(map(str if fmt is None else ("{:" + fmt + "}").format, data.tolist()))
+    if vmiss is not None:
+        for i in np.flatnonzero(missing).tolist():
+            strs[i] = str(vmiss)
+    return strs
+
+
+def _column_data(values: np.ndarray, fmt, vmiss=None):
+    """Unmasked data to format and mask of missing values (masked, NaN or equal to vmiss)."""
+    data = np.ma.getdata(values)
+    missing = np.ma.getmaskarray(values)
+    if data.dtype.kind == "f":
+        missing = missing | np.isnan(data)
+    if vmiss is not None and data.dtype.kind in "fiu":
+        try:
+            miss = float(vmiss)
+        except ValueError:  # VMISS is not a number, only used as fill text
+            pass
+        else:  # e.g. -9999.0 as parsed by the numeric reader
+            missing = missing | _is_vmiss(data, miss)
+    if data.dtype.kind == "f" and fmt and fmt[-1] in "bcdoxX":
+        data = np.where(missing, 0, np.rint(data))
+        if np.all(np.abs(data) < 2**63):
+            data = data.astype(np.int64)
+        else:  # beyond int64, e.g. 1e300, as Python int; inf raises like int()
+            data = np.array([int(r) for r in data.tolist()], dtype=object)
+    return data, missing
+
+
+def _fixed_decimals(fmt):
+    """Number of decimals if fmt is "d" or ".<n>f" (n <= 15), else None."""
+    if fmt == "d":
+        return 0
+    if fmt and fmt[0] == "." and fmt[-1] == "f" and fmt[1:-1].isdigit() and int(fmt[1:-1]) <= 15:
+        return int(fmt[1:-1])
+    return None
+
+
+def _encodable(values, fmt) -> bool:
+    """True if values can be formatted with _encode_fixed."""
+    if not isinstance(values, np.ndarray) or _fixed_decimals(fmt) is None:
+        return False
+    return values.dtype.kind in "fi" or (values.dtype.kind == "u" and values.dtype.itemsize < 8)
+
+
+def _encode_column(values, fmt, vmiss=None):
+    """
+    Values of a numeric array formatted with "d" or ".<n>f" as right-aligned ASCII
+    text of shape (n_values, width), padded with NUL bytes; None for other input.
+    """
+    if not _encodable(values, fmt):
+        return None
+    data, missing = _column_data(values, fmt, vmiss)
+    if data.dtype.kind == "O":
+        return None
+    text, redo = _encode_fixed(data, _fixed_decimals(fmt), float_format=fmt != "d")
+
+    # VMISS, and the few values that cannot be encoded exactly
+    fill = []
+    if vmiss is not None:
+        fill.append((np.flatnonzero(missing), str(vmiss)))
+        redo = redo & ~missing
+    fill += [(i, format(data[i].item(), fmt)) for i in np.flatnonzero(redo).tolist()]
+    width = max((len(s) for _, s in fill), default=0)
+    if width > text.shape[1]:
+        text = np.pad(text, ((0, 0), (width - text.shape[1], 0)))
+    for i, s in fill:
+        text[i] = 0
+        text[i, text.shape[1] - len(s) :] = np.frombuffer(s.encode("ascii"), np.uint8)
+    return text
+
+
+def _join_text(blocks: list[np.ndarray], sep: str) -> str:
+    """Rows of NUL-padded text blocks, joined by sep and terminated by a newline."""
+    n = blocks[0].shape[0]
+    sep_col = np.broadcast_to(np.frombuffer(sep.encode("ascii"), np.uint8), (n, len(sep)))
+    eol_col = np.full((n, 1), ord("\n"), np.uint8)
+    parts = [p for block in blocks for p in (block, sep_col)]
+    parts[-1] = eol_col
+    text = np.hstack(parts)
+    return text[text != 0].tobytes().decode("ascii")
+
+
+_DIGIT_QUADS = np.frombuffer("".join(f"{i:04d}" for i in range(10_000)).encode(), np.uint32)
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _encode_fixed(
+    values: np.ndarray, decimals: int, float_format=True
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized format(v, f".{decimals}f") of a numeric array; format(v, "d") for
+    integer arrays if float_format is False.
+
+    Values are scaled to integers by 10**decimals and converted four digits at a
+    time with a lookup table. Returns right-aligned, NUL-padded text of shape
+    (n_values, width) and a mask of values that are not encoded exactly
+    (non-finite, too large, or too close to a rounding tie to decide it from
+    the scaled float), which have to be formatted by format().
+    """
+    n = values.size
+    if values.dtype.kind == "f":
+        neg = np.signbit(values)
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled = np.abs(values.astype(np.float64)) * 10.0**decimals
+            # below 2**36, the error of the scaled float is well below the tie margin
+            redo = ~(scaled < 2**36) | (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-4)
+        q = np.rint(np.where(redo, 0, scaled)).astype(np.int64)
+    else:
+        values = values.astype(np.int64)
+        limit = 10 ** (18 - decimals)
+        if float_format:  # format() converts to float, which is exact up to 2**53
+            limit = min(limit, 2**53 + 1)
+        redo = (values >= limit) | (values <= -limit)
+        q = np.where(redo, 0, values)
+        neg = q < 0
+        q = np.abs(q) * _POW10[decimals]
+
+    # digits of q, zero-padded to cover the decimals and one integer digit
+    n_digits = np.maximum(np.searchsorted(_POW10, q, side="right"), decimals + 1)
+    width = int(n_digits.max(initial=1))
+    n_quads = (width + 3) // 4
+    quads = np.empty((n, n_quads), np.uint32)
+    for k in range(n_quads):
+        q, rest = np.divmod(q, 10_000)
+        quads[:, n_quads - 1 - k] = _DIGIT_QUADS[rest]
+    digits = quads.view(np.uint8)[:, 4 * n_quads - width :]
+
+    # sign slot, integer digits, point, decimals
+    point = 1 if decimals else 0
+    text = np.empty((n, width + point + 1), np.uint8)
+    text[:, 0] = 0
+    if decimals:
+        text[:, 1 : -decimals - 1] = digits[:, :-decimals]
+        text[:, -decimals - 1] = ord(".")
+        text[:, -decimals:] = digits[:, -decimals:]
+    else:
+        text[:, 1:] = digits
+    # blank leading zeros and place the sign; the last decimals + 1 digits always stay
+    first = text.shape[1] - n_digits - point
+    for j in range(text.shape[1] - decimals - 1 - point):
+        sign = np.where(neg & (first - 1 == j), ord("-"), 0).astype(np.uint8)
+        text[:, j] = np.where(first > j, sign, text[:, j])
+    return text, redo
 
-        line = ""
-        for i in range(n_vars):
-            line += str(na_1001["VSCAL"][i]) + sep
-        line = line[0:-1] if line.endswith("\n") else line[0:-1] + "\n"
-        file_obj.write(line)
 
-        line = ""
-        for i in range(n_vars):
-            line += str(na_1001["VMISS"][i]) + sep
-        line = line[0:-1] if line.endswith("\n") else line[0:-1] + "\n"
-        file_obj.write(line)
+###############################################################################
 
-        block = na_1001["_VNAME"]
-        for i in range(n_vars):
-            file_obj.write(block[i] + "\n")
 
-        nscoml = na_1001["NSCOML"]  # get number of special comment lines
-        line = str(nscoml) + "\n"
-        file_obj.write(line)
+class NA1001Header(object):
+    """
+    Header of NASA Ames 1001 files that share a schema, rendered once.
 
-        block = na_1001["_SCOM"]
-        for i in range(nscoml):
-            file_obj.write(block[i] + "\n")
+    All header lines but IVOL/NVOL, DATE/RDATE and DX are rendered on creation;
+    render only fills in these per-file lines. Pass as header to
+    FFI1001.to_file, to_volumes or iter_bytes, e.g. when converting many small
+    files with the same variables:
 
-        nncoml = na_1001["NNCOML"]  # get number of normal comment lines
-        line = str(nncoml) + "\n"
-        file_obj.write(line)
+    >>> template = NA1001Header(na)
+    >>> for date, (x, v) in records:
+    ...     na.DATE, na.X, na.V = date, x, v
+    ...     na.to_file(f"{date}.na", header=template)
 
-        block = na_1001["_NCOM"]
-        for i in range(nncoml):
-            file_obj.write(block[i] + "\n")
+    Parameters
+    ----------
+    na : FFI1001
+        Provides the shared header lines. NV, NSCOML, NNCOML and NLHEAD are
+        derived from VNAME, SCOM and NCOM.
+    sep : str, optional
+        General delimiter. The default is " ".
+    """
 
-        for i, x in enumerate(na_1001["_X"]):
-            line = str(x) + sep_data
-            for j in range(n_vars):
-                line += str(na_1001["_V"][j][i]) + sep_data
-            file_obj.write(line[0:-1] + "\n")
+    __slots__ = ("_head", "_tail", "nv", "sep")
 
-    return write
+    def __init__(self, na: FFI1001, sep=" "):
+        header = {k: getattr(na, k) for k in KEYS if k not in ("DX", "_DATA")}
+        _correct_header(header, lambda *a, **k: None)
+        self.sep = sep
+        self.nv = header["NV"]
+        self._head, self._tail = _header_parts(header, sep)
+
+    def render(self, na_1001: dict) -> str:
+        """Complete header with IVOL, NVOL, DATE, RDATE and DX from na_1001."""
+        if len(na_1001["_V"]) != self.nv:
+            raise ValueError(
+                f"NA error: header template has {self.nv} variables, data has {len(na_1001['_V'])}"
+            )
+        return self._head + _header_per_file(na_1001, self.sep) + self._tail
 
 
 ###############################################################################
+
+
+class NA1001Writer(object):
+    r"""
+    Write a NASA Ames 1001 file incrementally, e.g. from continuously acquired data.
+
+    The header is written once on opening; rows are appended with write_rows.
+    NLHEAD does not depend on the number of rows, so the header is final
+    as written. Use as a context manager:
+
+    >>> with NA1001Writer("data.na", na) as w:
+    ...     w.write_rows(x, v)
+
+    Parameters
+    ----------
+    file : str or pathlib.Path
+        filepath and -name of the destination.
+    na : FFI1001
+        Provides the header, i.e. all attributes but X and V. DX is written as
+        found in na, since X is not known in advance.
+    sep : str, optional
+        General delimiter. The default is " ".
+    sep_data : str, optional
+        Delimiter to separate data columns. The default is "\t".
+    overwrite : int, optional
+        Set to 1 to overwrite existing files; otherwise FileExistsError is raised.
+        The default is 0 (no overwrite).
+    formats : str or list of str, optional
+        Format spec for numeric V, see FFI1001.to_file. The default is None,
+        which uses the formats of na if any, else str().
+    x_format : str, optional
+        Format spec for numeric X. The default is None.
+    flush : bool, optional
+        Flush to disk after each call of write_rows. The default is True.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, Path],
+        na: FFI1001,
+        sep=" ",
+        sep_data="\t",
+        overwrite=0,
+        formats=None,
+        x_format=None,
+        flush=True,
+    ):
+        self.path = Path(file)
+        self.sep_data = sep_data
+        self.flush = flush
+        self.n_rows = 0
+        self._header = na._as_dict()
+        self._header.pop("_DATA")
+        _correct_header(self._header, lambda *a, **k: None)
+        x_fmt, v_fmts = self._header["_FORMATS"] or (None, None)
+        self._formats = (
+            x_fmt if x_format is None else x_format,
+            _check_formats(v_fmts if formats is None else formats, self._header["NV"]),
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w" if overwrite else "x", encoding="ascii")  # noqa: SIM115
+        self._file.write(_render_header(self._header, sep))
+        if self.flush:
+            self._file.flush()
+
+    def write_rows(self, x, v):
+        """
+        Append rows to the data block.
+
+        Parameters
+        ----------
+        x : array-like
+            independent variable, shape (n_rows,); numbers or str. Numbers are
+            formatted with the formats of the writer, also if given as list.
+        v : array-like
+            dependent variables, shape (NV, n_rows); numbers or str. NaN of
+            numbers is written as VMISS.
+
+        """
+        if len(v) != self._header["NV"]:
+            raise ValueError(f"NA error: got {len(v)} variables, NV is {self._header['NV']}!")
+        x, v = _numeric_lists(x, v)
+        self._file.writelines(
+            _iter_formatted(x, v, self._header["VMISS"], self._formats, self.sep_data)
+        )
+        self.n_rows += len(x)
+        if self.flush:
+            self._file.flush()
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "NA1001Writer":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def na1001_append_rows(
+    file_path,
+    x,
+    v,
+    vnames=None,
+    vmiss=None,
+    sep_data="\t",
+    formats=None,
+    x_format=None,
+    **kwargs,
+):
+    """
+    Append rows to the data block of an existing NASA Ames 1001 file.
+
+    See class method for detailled docstring.
+    """
+    with open(file_path, "rb") as f:
+        # the header is validated against all variables of the file
+        options = _header_options(kwargs, "append_rows", ("variables", "physical", "dtype"))
+        na_1001 = na1001_cls_read(_read_header(f), allow_emtpy_data=True, **options)
+        f.seek(-1, os.SEEK_END)  # header is not empty
+        missing_eol = f.read(1) != b"\n"
+
+    if len(v) != na_1001["NV"]:
+        raise ValueError(f"NA error: got {len(v)} variables, NV of {file_path} is {na_1001['NV']}!")
+    if vnames is not None and list(vnames) != na_1001["_VNAME"]:
+        raise ValueError(f"NA error: VNAME of {file_path} differs from vnames")
+    if vmiss is not None and (
+        len(vmiss) != na_1001["NV"] or not all(map(_equal_vmiss, vmiss, na_1001["VMISS"]))
+    ):
+        raise ValueError(f"NA error: VMISS of {file_path} differs from vmiss")
+
+    x, v = _numeric_lists(x, v)
+    rows = _iter_formatted(
+        x, v, na_1001["VMISS"], (x_format, _check_formats(formats, len(v))), sep_data
+    )
+    with open(file_path, "a", encoding="ascii") as file_obj:
+        if missing_eol:
+            file_obj.write("\n")
+        file_obj.writelines(rows)
+    return len(x)
+
+
+def _equal_vmiss(a, b) -> bool:
+    """VMISS entries compared as numbers (NaN equals NaN), as str if not numeric."""
+    try:
+        a_num, b_num = float(a), float(b)
+    except ValueError:
+        return str(a) == str(b)
+    return a_num == b_num or (np.isnan(a_num) and np.isnan(b_num))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Regression check: the vectorized encoder of the NA writer against format().
+
+Run from the repository root with ``python -m pytest``.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from na_lib.na1001 import _encodable, _format_column
+
+VMISS = "-9999"
+FORMATS = ["d", ".0f", ".1f", ".2f", ".3f", ".4f", ".6f", ".10f", ".15f"]
+
+FLOATS = [
+    0.0, -0.0, 0.5, 1.5, 2.5, -0.5, -2.5, 0.125, -0.375, 0.0625, 0.05, 0.15, 0.25, 0.35,
+    -0.01, 1e-7, -1e-7, 5e-324, 1 / 3, -2 / 3, 0.9995, 9.9999995, 99.995, 123456.789,
+    -987654.321, 2**36 - 0.5, 2**36, 2**36 + 0.5, 2**53, 1e15, -1e16, 1e18, 1e300,
+    -9999.0, -9999.5, math.nan, math.inf, -math.inf,
+]  # fmt: skip
+INTS = [
+    0, 1, -1, 9, 10, -10, 9999, 10_000, -10_000, 2**31 - 1, -(2**31), 10**14, 10**17,
+    10**18 - 1, -(10**18), 2**53 - 1, 2**53, 2**53 + 1, -(2**53) - 1, 158595601080281559,
+    2**63 - 1, -(2**63), -9999,
+]  # fmt: skip
+
+
+def _reference(values: np.ndarray, fmt: str) -> list[str]:
+    """format() of each value; NaN and VMISS as VMISS, floats rounded for "d"."""
+    out = []
+    for v in values.tolist():
+        if (isinstance(v, float) and math.isnan(v)) or v == float(VMISS):
+            out.append(VMISS)
+        elif fmt == "d" and isinstance(v, float):
+            out.append(format(int(np.rint(v)), fmt))
+        else:
+            out.append(format(v, fmt))
+    return out
+
+
+def _cases(dtype) -> np.ndarray:
+    """Edge values representable in dtype."""
+    if np.dtype(dtype).kind == "f":
+        with np.errstate(over="ignore"):  # 1e300 is inf in float32
+            return np.array(FLOATS).astype(dtype)
+    info = np.iinfo(dtype)
+    return np.array([v for v in INTS if info.min <= v <= info.max], dtype=dtype)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64, np.int32, np.uint32, np.int8])
+def test_edge_values(dtype, fmt):
+    values = _cases(dtype)
+    if fmt == "d" and values.dtype.kind == "f":  # "d" of inf is undefined
+        values = values[~np.isinf(values)]
+    assert _encodable(values, fmt)
+    assert _format_column(values, fmt, VMISS) == _reference(values, fmt)
+
+
+@pytest.mark.parametrize("decimals", range(16))
+def test_rounding_ties(decimals):
+    # values at and next to the rounding tie of the last decimal
+    rng = np.random.default_rng(decimals)
+    base = np.round(rng.uniform(-1e4, 1e4, 2000), decimals) + 0.5 * 10.0**-decimals
+    values = np.concatenate([base, np.nextafter(base, np.inf), np.nextafter(base, -np.inf)])
+    fmt = f".{decimals}f"
+    assert _format_column(values, fmt, VMISS) == _reference(values, fmt)
+
+
+def test_masked():
+    values = np.ma.MaskedArray([1.25, 2.5, 3.75], mask=[False, True, False])
+    assert _format_column(values, ".1f", VMISS) == ["1.2", VMISS, "3.8"]